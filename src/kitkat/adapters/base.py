@@ -5,6 +5,7 @@ must follow. It enables swappable DEX implementations and parallel fan-out
 execution to multiple DEXs.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from typing import Awaitable, Callable, AsyncContextManager, Optional, Literal
@@ -143,6 +144,35 @@ class DEXAdapter(ABC):
             DEXTimeoutError: DEX didn't respond in time (retryable)
         """
 
+    async def get_order_statuses(self, order_ids: list[str]) -> list[OrderStatus]:
+        """Get status of several orders concurrently (optional, can be overridden).
+
+        Default implementation: issues get_order_status() for every ID at once
+        in an asyncio.TaskGroup, so polling after a burst of orders costs one
+        round trip of latency instead of one per order. If one lookup fails,
+        the TaskGroup cancels the rest. Adapters with a native batch endpoint
+        can override this.
+
+        Args:
+            order_ids: Order IDs returned by execute_order()
+
+        Returns:
+            OrderStatus for each ID, in the same order as order_ids
+
+        Raises:
+            Same as get_order_status(); the first failure is propagated.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self.get_order_status(order_id))
+                    for order_id in order_ids
+                ]
+        except ExceptionGroup as group:
+            # Surface the DEX error itself, not the TaskGroup wrapper
+            raise group.exceptions[0] from None
+        return [task.result() for task in tasks]
+
     def subscribe_to_order_updates(
         self,
         callback: Callable[[OrderUpdate], Awaitable[None]],
@@ -7,6 +7,7 @@ API Documentation: https://api.docs.extended.exchange/
 """
 
 import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -55,8 +56,68 @@ _tenacity_logger = logging.getLogger("kitkat.adapters.extended.retry")
 # Extended API constants
 USER_AGENT = "kitkat/1.0"
 
-# Nonce counter for order uniqueness (simple in-memory, thread-safe with asyncio)
-_nonce_counter = 0
+# Extended API endpoint paths (relative to the client's base_url)
+POSITIONS_PATH = "/user/positions"
+ORDER_PATH = "/user/order"
+ORDERS_PATH_PREFIX = "/user/orders/"
+
+# Keep idle connections alive across bursts of signals so orders reuse an
+# established TLS connection instead of paying a fresh handshake.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0)
+
+# How long a healthy probe result is reused before hitting the API again
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
+# How long a fetched positions list serves get_position() lookups
+POSITIONS_CACHE_TTL_SECONDS = 0.5
+
+# Map Extended order statuses to our OrderStatus values
+ORDER_STATUS_MAP = {
+    "PENDING": "pending",
+    "FILLED": "filled",
+    "PARTIAL_FILL": "partial",
+    "CANCELLED": "cancelled",
+    "REJECTED": "failed",
+}
+
+# Shared zero values for the amounts most responses carry (e.g. unfilled
+# orders); keyed by wire string so the Decimal exponent is preserved.
+_ZERO_DECIMALS = {text: Decimal(text) for text in ("0", "0.0", "0.00")}
+_DECIMAL_ZERO = _ZERO_DECIMALS["0"]
+
+# Last issued order nonce (simple in-memory, safe within a single event loop)
+_last_nonce = 0
+
+
+def _require_connected(error_cls: type[DEXError]):
+    """Raise error_cls from the wrapped adapter method when not connected.
+
+    The error class is a parameter because execute_order must raise a
+    non-retryable DEXError (its tenacity policy retries DEXConnectionError),
+    while read-only methods raise DEXConnectionError.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self: "ExtendedAdapter", *args, **kwargs):
+            if not self._connected or not self._http_client:
+                raise error_cls("Not connected to Extended DEX")
+            return await method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _to_decimal(value: str) -> Decimal:
+    """Convert a wire amount to Decimal, reusing shared zero instances."""
+    zero = _ZERO_DECIMALS.get(value)
+    return zero if zero is not None else Decimal(value)
 
 
 class ExtendedAdapter(DEXAdapter):
@@ -100,6 +161,13 @@ class ExtendedAdapter(DEXAdapter):
         self._connected: bool = False
         self._connected_at: Optional[datetime] = None
         self._last_health_check: Optional[datetime] = None
+        # (monotonic_ns timestamp, status) of the last healthy probe
+        self._health_cache: Optional[tuple[int, HealthStatus]] = None
+        # (monotonic_ns timestamp, raw positions) from the last positions fetch
+        self._positions_cache: Optional[tuple[int, list[dict]]] = None
+        # Bumped on every invalidation, so a fetch that overlapped an order
+        # submission does not store positions that may already be stale
+        self._positions_generation: int = 0
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._log = logger.bind(dex_id=self.dex_id)
 
@@ -139,13 +207,50 @@ class ExtendedAdapter(DEXAdapter):
                 "User-Agent": USER_AGENT,
                 "Content-Type": "application/json",
             },
-            timeout=httpx.Timeout(10.0),
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
+
+        # The WebSocket handshake does not depend on the credential check, so
+        # it runs alongside it: connect() takes max(http, ws), not the sum.
+        ws_task = asyncio.create_task(self._connect_websocket())
+        try:
+            await self._verify_credentials()
+        except BaseException:
+            ws_task.cancel()
+            await asyncio.gather(ws_task, return_exceptions=True)
+            await self._cleanup_websocket()
+            raise
+
+        # Wait for the WebSocket handshake
+        try:
+            await ws_task
+        except Exception as e:
+            await self._cleanup_http_client()
+            self._log.error("WebSocket connection failed", error=str(e))
+            raise DEXConnectionError(
+                f"Failed to establish WebSocket connection: {e}"
+            ) from e
+
+        self._connected = True
+        self._connected_at = datetime.now(timezone.utc)
+        self._log.info(
+            "Connected to Extended DEX",
+            network=self._settings.extended_network,
+            connected_at=self._connected_at.isoformat(),
         )
 
-        # Verify credentials by fetching positions (requires valid API key)
-        # Extended API doesn't have explicit /health - use /user/positions
+    async def _verify_credentials(self) -> None:
+        """Verify the API key by fetching positions.
+
+        Extended API doesn't have explicit /health - use /user/positions.
+        Closes the HTTP client on failure.
+
+        Raises:
+            DEXConnectionError: If authentication or the request fails
+        """
         try:
-            response = await self._http_client.get("/user/positions")
+            response = await self._http_client.get(POSITIONS_PATH)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             await self._cleanup_http_client()
@@ -159,7 +264,7 @@ class ExtendedAdapter(DEXAdapter):
                 error_type=ErrorType.DEX_CONNECTION_FAILED,
                 error_message=f"Authentication failed ({e.response.status_code})",
                 request_method="GET",
-                request_url=str(self._settings.extended_api_base_url) + "/user/positions",
+                request_url=str(self._settings.extended_api_base_url) + POSITIONS_PATH,
                 response_status=e.response.status_code,
             )
             status_code = e.response.status_code
@@ -173,24 +278,6 @@ class ExtendedAdapter(DEXAdapter):
                 f"Failed to connect to Extended DEX: {e}"
             ) from e
 
-        # Establish WebSocket connection
-        try:
-            await self._connect_websocket()
-        except (RetryError, Exception) as e:
-            await self._cleanup_http_client()
-            self._log.error("WebSocket connection failed", error=str(e))
-            raise DEXConnectionError(
-                f"Failed to establish WebSocket connection: {e}"
-            ) from e
-
-        self._connected = True
-        self._connected_at = datetime.now(timezone.utc)
-        self._log.info(
-            "Connected to Extended DEX",
-            network=self._settings.extended_network,
-            connected_at=self._connected_at.isoformat(),
-        )
-
     @retry(
         stop=stop_after_attempt(10),
         wait=wait_exponential_jitter(initial=1, max=30, jitter=2),
@@ -256,18 +343,28 @@ class ExtendedAdapter(DEXAdapter):
 
         self._connected = False
         self._connected_at = None
+        self._health_cache = None
+        self._invalidate_positions_cache()
         self._log.info("Disconnected from Extended DEX")
 
     async def get_health_status(self) -> HealthStatus:
         """Get Extended DEX connection health status.
 
         Pings the positions endpoint and measures response latency.
-        Extended API doesn't have explicit /health endpoint.
+        Extended API doesn't have explicit /health endpoint. A healthy
+        result is reused for HEALTH_CACHE_TTL_SECONDS so frequent callers
+        don't each trigger a round trip.
 
         Returns:
             HealthStatus with connection info and latency
         """
-        start = time.monotonic()
+        start_ns = time.monotonic_ns()
+        if self._health_cache is not None and self._http_client:
+            cached_at_ns, cached_status = self._health_cache
+            if start_ns - cached_at_ns < HEALTH_CACHE_TTL_SECONDS * 1_000_000_000:
+                return cached_status
+
+        self._health_cache = None
         now = datetime.now(timezone.utc)
 
         if not self._http_client:
@@ -283,10 +380,10 @@ class ExtendedAdapter(DEXAdapter):
         try:
             # Use positions endpoint as health check (requires valid API key)
             response = await self._http_client.get(
-                "/user/positions",
+                POSITIONS_PATH,
                 timeout=5.0,
             )
-            latency = int((time.monotonic() - start) * 1000)
+            latency = (time.monotonic_ns() - start_ns) // 1_000_000
 
             if response.status_code == 200:
                 status = "healthy"
@@ -303,7 +400,7 @@ class ExtendedAdapter(DEXAdapter):
                 error_message = f"Server error: {response.status_code}"
 
             self._last_health_check = now
-            return HealthStatus(
+            health = HealthStatus(
                 dex_id=self.dex_id,
                 status=status,
                 connected=self._connected,
@@ -311,6 +408,9 @@ class ExtendedAdapter(DEXAdapter):
                 last_check=now,
                 error_message=error_message,
             )
+            if status == "healthy":
+                self._health_cache = (start_ns, health)
+            return health
 
         except httpx.TimeoutException:
             self._last_health_check = now
@@ -338,20 +438,25 @@ class ExtendedAdapter(DEXAdapter):
     # Order Execution Methods (Story 2.6)
     # =========================================================================
 
+    def _invalidate_positions_cache(self) -> None:
+        """Drop cached positions and any positions fetch still in flight."""
+        self._positions_cache = None
+        self._positions_generation += 1
+
     def _generate_nonce(self) -> int:
         """Generate unique nonce for order submission.
 
-        Uses microsecond timestamp combined with a monotonic counter
-        to ensure uniqueness even across server restarts.
+        Uses the nanosecond wall clock, bumped past the previous nonce when
+        calls land in the same tick, so nonces are strictly increasing within
+        the process and stay unique across server restarts.
 
         Returns:
             Unique integer nonce for order identification.
         """
-        global _nonce_counter
-        _nonce_counter += 1
-        # Microsecond timestamp avoids collisions across restarts
-        timestamp_us = int(time.time() * 1_000_000)
-        return (timestamp_us << 16) | (_nonce_counter & 0xFFFF)
+        global _last_nonce
+        now_ns = time.time_ns()
+        _last_nonce = now_ns if now_ns > _last_nonce else _last_nonce + 1
+        return _last_nonce
 
     def _create_order_signature(
         self,
@@ -384,13 +489,6 @@ class ExtendedAdapter(DEXAdapter):
         signature_bytes = hashlib.sha256(message.encode()).hexdigest()
         return f"0x{signature_bytes}"
 
-    @retry(
-        stop=stop_after_attempt(4),  # 1 initial + 3 retries
-        wait=wait_exponential_jitter(initial=1, max=8, jitter=2),
-        retry=retry_if_exception_type((DEXConnectionError, DEXTimeoutError)),
-        reraise=True,
-        before_sleep=before_sleep_log(_tenacity_logger, logging.WARNING),
-    )
     async def execute_order(
         self,
         symbol: str,
@@ -417,20 +515,41 @@ class ExtendedAdapter(DEXAdapter):
             DEXRejectionError: Order rejected by DEX
             DEXInsufficientFundsError: Not enough margin/balance
         """
-        # Validate order size before attempting submission
+        # Validate order size before entering the retry loop
         # Must be positive - NaN, Infinity, or zero values should fail early
         if not size or size <= 0:
             raise ValueError(f"Order size must be positive, got: {size}")
 
-        if not self._connected or not self._http_client:
-            # Use DEXError (not DEXConnectionError) to prevent retry on disconnected adapter.
-            # Tenacity decorator only retries DEXConnectionError and DEXTimeoutError.
-            # If adapter is not connected, retrying won't help - user must reconnect first.
-            raise DEXError("Not connected to Extended DEX")
+        return await self._submit_order(symbol, side, size)
+
+    @retry(
+        stop=stop_after_attempt(4),  # 1 initial + 3 retries
+        wait=wait_exponential_jitter(initial=1, max=8, jitter=2),
+        retry=retry_if_exception_type((DEXConnectionError, DEXTimeoutError)),
+        reraise=True,
+        before_sleep=before_sleep_log(_tenacity_logger, logging.WARNING),
+    )
+    # DEXError (not DEXConnectionError) so a disconnected adapter is not
+    # retried - the caller must reconnect first.
+    @_require_connected(DEXError)
+    async def _submit_order(
+        self,
+        symbol: str,
+        side: Literal["buy", "sell"],
+        size: Decimal,
+    ) -> OrderSubmissionResult:
+        """Sign and POST a validated order; retried on transient failures.
 
+        Every attempt signs with a fresh nonce. See execute_order() for the
+        arguments, result, and errors.
+        """
         log = self._log.bind(symbol=symbol, side=side, size=str(size))
         log.info("Submitting order")
 
+        # Any submission attempt may change positions. The cache is dropped
+        # again once the POST returns, as a fetch may have completed meanwhile.
+        self._invalidate_positions_cache()
+
         # Generate unique nonce for this order
         nonce = self._generate_nonce()
 
@@ -448,7 +567,7 @@ class ExtendedAdapter(DEXAdapter):
         }
 
         try:
-            response = await self._http_client.post("/user/order", json=payload)
+            response = await self._http_client.post(ORDER_PATH, json=payload)
 
             if response.status_code == 200:
                 data = response.json()
@@ -457,7 +576,7 @@ class ExtendedAdapter(DEXAdapter):
                     order_id=data["order_id"],
                     status="submitted",
                     submitted_at=datetime.now(timezone.utc),
-                    filled_amount=Decimal("0"),
+                    filled_amount=_DECIMAL_ZERO,
                     dex_response=data,
                 )
 
@@ -493,7 +612,7 @@ class ExtendedAdapter(DEXAdapter):
                 order_id=data.get("order_id", "unknown"),
                 status="submitted",
                 submitted_at=datetime.now(timezone.utc),
-                filled_amount=Decimal("0"),
+                filled_amount=_DECIMAL_ZERO,
                 dex_response=data,
             )
 
@@ -505,7 +624,7 @@ class ExtendedAdapter(DEXAdapter):
                 error_type=ErrorType.DEX_TIMEOUT,
                 error_message=f"Order submission timed out: {e}",
                 request_method="POST",
-                request_url=str(self._settings.extended_api_base_url) + "/user/order",
+                request_url=str(self._settings.extended_api_base_url) + ORDER_PATH,
             )
             raise DEXTimeoutError(f"Order submission timed out: {e}") from e
         except httpx.HTTPStatusError as e:
@@ -516,7 +635,7 @@ class ExtendedAdapter(DEXAdapter):
                 error_type=ErrorType.DEX_ERROR,
                 error_message=f"Order submission failed: HTTP {e.response.status_code}",
                 request_method="POST",
-                request_url=str(self._settings.extended_api_base_url) + "/user/order",
+                request_url=str(self._settings.extended_api_base_url) + ORDER_PATH,
                 response_status=e.response.status_code,
                 response_body=e.response.text,
             )
@@ -531,10 +650,13 @@ class ExtendedAdapter(DEXAdapter):
                 error_type=ErrorType.DEX_CONNECTION_FAILED,
                 error_message=f"Order submission failed: {e}",
                 request_method="POST",
-                request_url=str(self._settings.extended_api_base_url) + "/user/order",
+                request_url=str(self._settings.extended_api_base_url) + ORDER_PATH,
             )
             raise DEXConnectionError(f"Order submission failed: {e}") from e
+        finally:
+            self._invalidate_positions_cache()
 
+    @_require_connected(DEXConnectionError)
     async def get_order_status(self, order_id: str) -> OrderStatus:
         """Get order status from Extended DEX.
 
@@ -551,34 +673,23 @@ class ExtendedAdapter(DEXAdapter):
             DEXTimeoutError: Request timed out
             DEXOrderNotFoundError: Order ID not found
         """
-        if not self._connected or not self._http_client:
-            raise DEXConnectionError("Not connected to Extended DEX")
-
         log = self._log.bind(order_id=order_id)
         log.debug("Getting order status")
 
         try:
-            response = await self._http_client.get(f"/user/orders/{order_id}")
+            response = await self._http_client.get(ORDERS_PATH_PREFIX + order_id)
 
             if response.status_code == 200:
                 data = response.json()
 
-                # Map Extended status to our enum
-                status_map = {
-                    "PENDING": "pending",
-                    "FILLED": "filled",
-                    "PARTIAL_FILL": "partial",
-                    "CANCELLED": "cancelled",
-                    "REJECTED": "failed",
-                }
-                status = status_map.get(data["status"], "pending")
+                status = ORDER_STATUS_MAP.get(data["status"], "pending")
 
                 return OrderStatus(
                     order_id=data["order_id"],
                     status=status,
-                    filled_amount=Decimal(data["filled_amount"]),
-                    remaining_amount=Decimal(data["remaining_amount"]),
-                    average_price=Decimal(data["average_price"]),
+                    filled_amount=_to_decimal(data["filled_amount"]),
+                    remaining_amount=_to_decimal(data["remaining_amount"]),
+                    average_price=_to_decimal(data["average_price"]),
                     last_updated=datetime.fromisoformat(
                         data["updated_at"].replace("Z", "+00:00")
                     ),
@@ -608,6 +719,7 @@ class ExtendedAdapter(DEXAdapter):
             log.error("Order status failed", error=str(e))
             raise DEXConnectionError(f"Order status request failed: {e}") from e
 
+    @_require_connected(DEXConnectionError)
     async def get_position(self, symbol: str) -> Optional[Position]:
         """Get position for symbol from Extended DEX.
 
@@ -624,44 +736,52 @@ class ExtendedAdapter(DEXAdapter):
             DEXConnectionError: Not connected or network error
             DEXTimeoutError: Request timed out
         """
-        if not self._connected or not self._http_client:
-            raise DEXConnectionError("Not connected to Extended DEX")
-
         log = self._log.bind(symbol=symbol)
         log.debug("Getting position")
 
-        try:
-            response = await self._http_client.get("/user/positions")
-
-            if response.status_code == 200:
-                data = response.json()
-                positions = data.get("positions", [])
-
-                # Find position for requested symbol
-                for pos in positions:
-                    if pos["symbol"] == symbol:
-                        return Position(
-                            symbol=pos["symbol"],
-                            size=Decimal(pos["size"]),
-                            entry_price=Decimal(pos["entry_price"]),
-                            current_price=Decimal(pos["mark_price"]),
-                            unrealized_pnl=Decimal(pos["unrealized_pnl"]),
-                        )
-
-                # No position found for this symbol
-                log.debug("No position found", symbol=symbol)
-                return None
-
-            response.raise_for_status()
+        now_ns = time.monotonic_ns()
+        cached = self._positions_cache
+        if (
+            cached is not None
+            and now_ns - cached[0] < POSITIONS_CACHE_TTL_SECONDS * 1_000_000_000
+        ):
+            positions = cached[1]
+        else:
+            generation = self._positions_generation
+            try:
+                response = await self._http_client.get(POSITIONS_PATH)
+
+                if response.status_code != 200:
+                    response.raise_for_status()
+                    return None
+
+                positions = response.json().get("positions", [])
+                # Not cached if an order was submitted during the fetch
+                if generation == self._positions_generation:
+                    self._positions_cache = (now_ns, positions)
+
+            except httpx.TimeoutException as e:
+                log.error("Position request timeout", error=str(e))
+                raise DEXTimeoutError(f"Position request timed out: {e}") from e
+            except httpx.HTTPError as e:
+                log.error("Position request failed", error=str(e))
+                raise DEXConnectionError(f"Position request failed: {e}") from e
+
+        # Find position for requested symbol (stops at first match)
+        pos = next((p for p in positions if p["symbol"] == symbol), None)
+        if pos is None:
+            log.debug("No position found", symbol=symbol)
             return None
 
-        except httpx.TimeoutException as e:
-            log.error("Position request timeout", error=str(e))
-            raise DEXTimeoutError(f"Position request timed out: {e}") from e
-        except httpx.HTTPError as e:
-            log.error("Position request failed", error=str(e))
-            raise DEXConnectionError(f"Position request failed: {e}") from e
+        return Position(
+            symbol=pos["symbol"],
+            size=_to_decimal(pos["size"]),
+            entry_price=_to_decimal(pos["entry_price"]),
+            current_price=_to_decimal(pos["mark_price"]),
+            unrealized_pnl=_to_decimal(pos["unrealized_pnl"]),
+        )
 
+    @_require_connected(DEXConnectionError)
     async def cancel_order(self, order_id: str) -> None:
         """Cancel an open order on Extended DEX.
 
@@ -676,14 +796,11 @@ class ExtendedAdapter(DEXAdapter):
             DEXTimeoutError: Request timed out
             DEXOrderNotFoundError: Order not found or already filled/cancelled
         """
-        if not self._connected or not self._http_client:
-            raise DEXConnectionError("Not connected to Extended DEX")
-
         log = self._log.bind(order_id=order_id)
         log.info("Cancelling order")
 
         try:
-            response = await self._http_client.delete(f"/user/orders/{order_id}")
+            response = await self._http_client.delete(ORDERS_PATH_PREFIX + order_id)
 
             if response.status_code == 200:
                 log.info("Order cancelled", order_id=order_id)
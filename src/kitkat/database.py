@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import List
 
 import structlog
-from sqlalchemy import DateTime, ForeignKey, String, Text, event
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship, sessionmaker
 from sqlalchemy.types import TypeDecorator
@@ -223,6 +223,10 @@ class ExecutionModel(Base):
     """
 
     __tablename__ = "executions"
+    __table_args__ = (
+        # Serves the stats period scans: status IN (...) AND created_at range
+        Index("ix_executions_status_created_at", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     signal_id: Mapped[str] = mapped_column(
@@ -2,8 +2,9 @@
 
 import hashlib
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Protocol
 
 import structlog
 from eth_account import Account
@@ -14,6 +15,22 @@ logger = structlog.get_logger()
 # Challenge expiration time (5 minutes per spec)
 CHALLENGE_TTL_MINUTES = 5
 
+# Minimum seconds between full sweeps of expired challenges
+CHALLENGE_CLEANUP_INTERVAL_SECONDS = 60
+
+
+class ChallengeStoreProtocol(Protocol):
+    """Interface for challenge stores used by SignatureVerifier."""
+
+    def create_challenge(self, wallet_address: str) -> tuple[str, datetime, str]:
+        ...
+
+    def consume_challenge(self, nonce: str) -> Optional[tuple[str, datetime, str]]:
+        ...
+
+    def shutdown(self) -> None:
+        ...
+
 
 class ChallengeStore:
     """In-memory store for pending challenges with automatic expiration.
@@ -26,6 +43,7 @@ class ChallengeStore:
         """Initialize the challenge store."""
         self._challenges: dict[str, tuple[str, datetime, str]] = {}
         # Map of nonce -> (wallet_address, expires_at, message)
+        self._last_cleanup = time.monotonic()
 
     def create_challenge(self, wallet_address: str) -> tuple[str, datetime, str]:
         """Create a new challenge for the given wallet address.
@@ -45,8 +63,11 @@ class ChallengeStore:
         # Store the challenge
         self._challenges[nonce] = (wallet_address.lower(), expires_at, message)
 
-        # Cleanup expired challenges
-        self._cleanup_expired()
+        # Periodically sweep expired challenges (consume/get expire lazily)
+        now = time.monotonic()
+        if now - self._last_cleanup >= CHALLENGE_CLEANUP_INTERVAL_SECONDS:
+            self._cleanup_expired()
+            self._last_cleanup = now
 
         logger.info(
             "Challenge created",
@@ -103,15 +124,23 @@ class ChallengeStore:
     def consume_challenge(self, nonce: str) -> Optional[tuple[str, datetime, str]]:
         """Get and remove a challenge (single use).
 
+        The challenge is popped before the expiry check so a nonce can never
+        be observed twice, even if it has expired.
+
         Args:
             nonce: The challenge nonce.
 
         Returns:
             Tuple of (wallet_address, expires_at, message) or None if not found.
         """
-        challenge = self.get_challenge(nonce)
-        if challenge:
-            del self._challenges[nonce]
+        challenge = self._challenges.pop(nonce, None)
+        if not challenge:
+            return None
+
+        if challenge[1] < datetime.now(timezone.utc):
+            logger.info("Challenge expired", nonce=nonce[:8] + "...")
+            return None
+
         return challenge
 
     def _cleanup_expired(self) -> None:
@@ -140,7 +169,7 @@ class SignatureVerifier:
     of Ethereum personal_sign messages.
     """
 
-    def __init__(self, challenge_store: Optional[ChallengeStore] = None):
+    def __init__(self, challenge_store: Optional[ChallengeStoreProtocol] = None):
         """Initialize the signature verifier.
 
         Args:
@@ -13,14 +13,147 @@ Story 5.1: Stats Service & Volume Tracking
 """
 
 import json
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Iterable
 
 import structlog
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, case, func, or_, select
 
 from kitkat.database import ExecutionModel
-from kitkat.models import AggregatedVolumeStats, TimePeriod, VolumeStats
+from kitkat.models import (
+    AggregatedVolumeStats,
+    ExecutionPeriodStats,
+    TimePeriod,
+    VolumeStats,
+)
+
+# Statuses that contribute to volume (AC#4)
+_VOLUME_STATUSES = ("filled", "partial")
+
+# result_data is a JSON text column. Malformed JSON would make json_extract
+# raise, so such rows are read as an empty object instead.
+_RESULT_JSON = case(
+    (func.json_valid(ExecutionModel.result_data) == 1, ExecutionModel.result_data),
+    else_="{}",
+)
+
+# Test mode may be stored as JSON true or the string "true" (AC#4)
+_NOT_TEST_MODE = and_(
+    func.coalesce(func.json_type(_RESULT_JSON, "$.is_test_mode"), "") != "true",
+    func.coalesce(func.json_extract(_RESULT_JSON, "$.is_test_mode"), "") != "true",
+)
+
+# filled_size and fill_price are read as their raw JSON text (the -> operator),
+# not json_extract, which would hand JSON numbers back as float64. The text is
+# parsed to Decimal in Python so volume sums stay exact.
+_FILLED_SIZE_JSON = _RESULT_JSON.op("->")("$.filled_size")
+_FILL_PRICE_JSON = _RESULT_JSON.op("->")("$.fill_price")
+
+# Only numbers, numeric strings, or a missing key (read as zero) can make a
+# volume. Other JSON types are dropped in SQL; non-numeric strings are dropped
+# when parsed.
+_NUMERIC_JSON_TYPES = ("integer", "real", "text")
+
+
+def _numeric_or_missing(path: str):
+    json_type = func.json_type(_RESULT_JSON, path)
+    return or_(json_type.is_(None), json_type.in_(_NUMERIC_JSON_TYPES))
+
+
+_HAS_NUMERIC_FILL = and_(
+    _numeric_or_missing("$.filled_size"),
+    _numeric_or_missing("$.fill_price"),
+)
+
+# Volume rows are streamed in chunks of this size and summed as they arrive,
+# so an all_time scan never holds every matching execution in memory.
+_VOLUME_YIELD_PER = 1000
+
+# Volume queries are built once at import. Period bounds (and the DEX filter)
+# are bound per call, so SQLAlchemy reuses the cached compiled statement
+# instead of rebuilding the filter tree on every stats request.
+_VOLUME_QUERY = (
+    select(ExecutionModel.id, _FILLED_SIZE_JSON, _FILL_PRICE_JSON)
+    .where(
+        ExecutionModel.status.in_(_VOLUME_STATUSES),
+        ExecutionModel.created_at >= bindparam("start_dt"),
+        ExecutionModel.created_at <= bindparam("end_dt"),
+        _NOT_TEST_MODE,
+        _HAS_NUMERIC_FILL,
+    )
+    .execution_options(yield_per=_VOLUME_YIELD_PER)
+)
+_VOLUME_BY_DEX_QUERY = _VOLUME_QUERY.where(
+    ExecutionModel.dex_id == bindparam("dex_id")
+)
+_VOLUME_ORDERED_BY_DEX_QUERY = (
+    select(
+        ExecutionModel.dex_id,
+        ExecutionModel.id,
+        _FILLED_SIZE_JSON,
+        _FILL_PRICE_JSON,
+    )
+    .where(
+        ExecutionModel.status.in_(_VOLUME_STATUSES),
+        ExecutionModel.created_at >= bindparam("start_dt"),
+        ExecutionModel.created_at <= bindparam("end_dt"),
+        _NOT_TEST_MODE,
+        _HAS_NUMERIC_FILL,
+    )
+    .order_by(ExecutionModel.dex_id)
+    .execution_options(yield_per=_VOLUME_YIELD_PER)
+)
+
+# Execution counts per status for success rate (Story 5.3). Test mode is
+# filtered in SQL, so result_data is never parsed in Python.
+_EXECUTION_STATUSES = ("filled", "partial", "failed")
+_EXECUTION_COUNTS_QUERY = (
+    select(ExecutionModel.status, func.count())
+    .where(
+        ExecutionModel.status.in_(_EXECUTION_STATUSES),
+        ExecutionModel.created_at >= bindparam("start_dt"),
+        ExecutionModel.created_at <= bindparam("end_dt"),
+        _NOT_TEST_MODE,
+    )
+    .group_by(ExecutionModel.status)
+)
+
+
+def _json_decimal(raw: str | None) -> Decimal:
+    """Parse one JSON scalar from result_data as an exact Decimal.
+
+    A missing key reads as zero. JSON numbers are parsed straight to Decimal,
+    so no float64 rounding creeps in.
+
+    Raises:
+        ArithmeticError, ValueError, TypeError: If the value is not a finite
+            number or numeric string.
+    """
+    if raw is None:
+        return Decimal("0")
+    value = json.loads(raw, parse_float=Decimal)
+    if isinstance(value, bool):
+        raise TypeError(f"Expected a number, got {raw}")
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    if not value.is_finite():
+        raise ValueError(f"Expected a finite number, got {raw}")
+    return value
+
+
+def _row_volume(log, execution_id: int, filled_size, fill_price) -> Decimal | None:
+    """Return filled_size * fill_price for one row, or None if it is malformed."""
+    try:
+        return _json_decimal(filled_size) * _json_decimal(fill_price)
+    except (ArithmeticError, ValueError, TypeError):
+        log.warning(
+            "Skipping execution with invalid volume data",
+            execution_id=execution_id,
+        )
+        return None
 
 
 class StatsService:
@@ -30,30 +163,47 @@ class StatsService:
     Implements caching with configurable TTL for performance.
     """
 
-    def __init__(self, session_factory, cache_ttl: int = 60):
+    def __init__(
+        self,
+        session_factory,
+        cache_ttl: int = 60,
+        cache_max_entries: int = 1024,
+    ):
         """Initialize StatsService.
 
         Args:
             session_factory: Async SQLAlchemy session factory
             cache_ttl: Cache time-to-live in seconds (default: 60)
+            cache_max_entries: Max entries per cache before LRU eviction
+                (default: 1024)
         """
         self._session_factory = session_factory
         self._log = structlog.get_logger().bind(service="stats")
-        self._volume_cache: dict[str, tuple[VolumeStats, datetime]] = {}
+        # Cache values are (stats, time.monotonic() at insert), kept in LRU order.
+        # Aggregated stats share this cache under an "aggregated" dex_id slot.
+        self._volume_cache: OrderedDict[
+            tuple, tuple[VolumeStats | AggregatedVolumeStats, float]
+        ] = OrderedDict()
+        self._exec_cache: OrderedDict[tuple, tuple[ExecutionPeriodStats, float]] = (
+            OrderedDict()
+        )
         self._cache_ttl = cache_ttl
+        self._cache_max_entries = cache_max_entries
 
     def _calculate_period_bounds(
-        self, period: TimePeriod
+        self, period: TimePeriod, now: datetime | None = None
     ) -> tuple[datetime, datetime]:
         """Calculate start/end timestamps for a period (UTC).
 
         Args:
             period: Time period ("today", "this_week", "this_month", "all_time")
+            now: Reference time; read from the clock if not given
 
         Returns:
             Tuple of (start_datetime, end_datetime) both timezone-aware UTC
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         if period == "today":
             start = now.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -83,7 +233,7 @@ class StatsService:
         user_id: int | None,
         dex_id: str | None,
         period: TimePeriod,
-    ) -> str:
+    ) -> tuple:
         """Generate cache key for volume stats query.
 
         Args:
@@ -92,11 +242,11 @@ class StatsService:
             period: Time period
 
         Returns:
-            Cache key string in format "user_id:dex_id:period"
+            Cache key tuple (user_id, dex_id, period)
         """
-        return f"{user_id or 'all'}:{dex_id or 'all'}:{period}"
+        return (user_id, dex_id, period)
 
-    def _is_cache_valid(self, key: str) -> bool:
+    def _is_cache_valid(self, key: tuple) -> bool:
         """Check if cached entry is still valid (within TTL).
 
         Args:
@@ -105,11 +255,23 @@ class StatsService:
         Returns:
             True if cache entry exists and is within TTL
         """
-        if key not in self._volume_cache:
+        entry = self._volume_cache.get(key)
+        if entry is None:
             return False
-        _, cached_at = self._volume_cache[key]
-        elapsed = (datetime.now(timezone.utc) - cached_at).total_seconds()
-        return elapsed < self._cache_ttl
+        return time.monotonic() - entry[1] < self._cache_ttl
+
+    def _cache_store(self, cache: OrderedDict, key: tuple, stats) -> None:
+        """Store a cache entry, evicting least recently used entries past the limit.
+
+        Args:
+            cache: The cache to store into
+            key: Cache key
+            stats: Stats object to cache
+        """
+        cache[key] = (stats, time.monotonic())
+        cache.move_to_end(key)
+        while len(cache) > self._cache_max_entries:
+            cache.popitem(last=False)
 
     def invalidate_cache(self, user_id: int | None = None) -> None:
         """Invalidate cache entries for a user or all entries.
@@ -120,33 +282,40 @@ class StatsService:
             user_id: If provided, only invalidate entries for this user.
                      If None, invalidate all cache entries.
         """
-        # Initialize exec cache if needed
-        if not hasattr(self, "_exec_cache"):
-            self._exec_cache: dict[str, tuple] = {}
-
         if user_id is None:
             self._volume_cache.clear()
             self._exec_cache.clear()
             self._log.debug("Cache cleared completely")
         else:
-            # Invalidate volume cache
-            keys_to_remove = [
-                k for k in self._volume_cache if k.startswith(f"{user_id}:")
-            ]
-            for k in keys_to_remove:
-                del self._volume_cache[k]
-            # Invalidate execution cache (Story 5.3)
-            exec_keys_to_remove = [
-                k for k in self._exec_cache if f":{user_id}:" in k
-            ]
-            for k in exec_keys_to_remove:
-                del self._exec_cache[k]
-            self._log.debug(
-                "Cache invalidated for user",
-                user_id=user_id,
-                volume_keys_removed=len(keys_to_remove),
-                exec_keys_removed=len(exec_keys_to_remove),
-            )
+            self.invalidate_many([user_id])
+
+    def invalidate_many(self, user_ids: Iterable[int]) -> None:
+        """Invalidate cache entries for several users in one pass.
+
+        Use after batch execution inserts instead of calling invalidate_cache
+        per user; each cache is scanned once regardless of batch size.
+
+        Args:
+            user_ids: Users whose cached stats should be dropped
+        """
+        user_id_set = set(user_ids)
+        if not user_id_set:
+            return
+
+        # Invalidate volume cache
+        keys_to_remove = [k for k in self._volume_cache if k[0] in user_id_set]
+        for k in keys_to_remove:
+            del self._volume_cache[k]
+        # Invalidate execution cache (Story 5.3)
+        exec_keys_to_remove = [k for k in self._exec_cache if k[0] in user_id_set]
+        for k in exec_keys_to_remove:
+            del self._exec_cache[k]
+        self._log.debug(
+            "Cache invalidated for users",
+            user_ids=sorted(user_id_set),
+            volume_keys_removed=len(keys_to_remove),
+            exec_keys_removed=len(exec_keys_to_remove),
+        )
 
     async def get_volume_stats(
         self,
@@ -172,6 +341,7 @@ class StatsService:
         # Check cache first (AC#5)
         if self._is_cache_valid(cache_key):
             stats, _ = self._volume_cache[cache_key]
+            self._volume_cache.move_to_end(cache_key)
             self._log.debug(
                 "Cache hit",
                 cache_key=cache_key,
@@ -180,7 +350,10 @@ class StatsService:
             return stats
 
         # Calculate fresh stats from database
-        start_dt, end_dt = self._calculate_period_bounds(period)
+        # Single clock read: the same instant bounds the query and stamps
+        # last_updated.
+        now = datetime.now(timezone.utc)
+        start_dt, end_dt = self._calculate_period_bounds(period, now)
 
         log = self._log.bind(
             user_id=user_id,
@@ -190,61 +363,28 @@ class StatsService:
             end_dt=end_dt.isoformat(),
         )
 
-        async with self._session_factory() as session:
-            # Build query for volume calculation (AC#4)
-            # Filter: status in (filled, partial), within period, exclude test mode
-            query = (
-                select(ExecutionModel)
-                .where(
-                    and_(
-                        ExecutionModel.status.in_(["filled", "partial"]),
-                        ExecutionModel.created_at >= start_dt,
-                        ExecutionModel.created_at <= end_dt,
-                    )
-                )
-            )
-
-            if dex_id:
-                query = query.where(ExecutionModel.dex_id == dex_id)
-
-            result = await session.execute(query)
-            executions = result.scalars().all()
+        # Volume query (AC#4): status in (filled, partial), within period,
+        # test mode excluded in SQL. Only the two fill values come back.
+        params = {"start_dt": start_dt, "end_dt": end_dt}
+        if dex_id:
+            query = _VOLUME_BY_DEX_QUERY
+            params["dex_id"] = dex_id
+        else:
+            query = _VOLUME_QUERY
 
-        # Calculate volume manually to handle JSON parsing (AC#4)
+        # Summed as Decimal in Python: SQLite would sum in float64 (AC#4).
+        # Rows are streamed, so the sum runs while later chunks are fetched.
         total_volume = Decimal("0")
         execution_count = 0
-
-        for execution in executions:
-            # Parse result_data JSON
-            try:
-                if isinstance(execution.result_data, str):
-                    result_data = json.loads(execution.result_data)
-                else:
-                    result_data = execution.result_data or {}
-            except (json.JSONDecodeError, TypeError):
-                result_data = {}
-
-            # Exclude test mode executions (AC#4)
-            is_test_mode = result_data.get("is_test_mode", False)
-            if is_test_mode is True or is_test_mode == "true":
-                continue
-
-            # Calculate volume: filled_size * fill_price
-            try:
-                filled_size = Decimal(str(result_data.get("filled_size", "0")))
-                fill_price = Decimal(str(result_data.get("fill_price", "0")))
-                volume = filled_size * fill_price
+        async with self._session_factory() as session:
+            rows = await session.stream(query, params)
+            async for execution_id, filled_size, fill_price in rows:
+                volume = _row_volume(log, execution_id, filled_size, fill_price)
+                if volume is None:
+                    continue
                 total_volume += volume
                 execution_count += 1
-            except (ValueError, TypeError, KeyError):
-                # Skip malformed entries
-                log.warning(
-                    "Skipping execution with invalid volume data",
-                    execution_id=execution.id,
-                )
-                continue
 
-        now = datetime.now(timezone.utc)
         stats = VolumeStats(
             dex_id=dex_id or "all",
             period=period,
@@ -254,7 +394,7 @@ class StatsService:
         )
 
         # Cache the result (AC#5)
-        self._volume_cache[cache_key] = (stats, now)
+        self._cache_store(self._volume_cache, cache_key, stats)
 
         log.info(
             "Volume stats calculated",
@@ -271,61 +411,83 @@ class StatsService:
     ) -> AggregatedVolumeStats:
         """Get aggregated volume across all DEXs with breakdown.
 
-        Queries all DEXs and provides both totals and per-DEX stats.
+        Reads the fill values of every DEX in a single query, ordered by DEX,
+        and sums per-DEX volume and the totals from those rows in Python.
 
         Args:
-            user_id: Optional filter by user ID
+            user_id: Optional user scope. Executions carry no user column, so
+                this only keys the cache and the log, as in get_volume_stats.
             period: Time period for aggregation
 
         Returns:
             AggregatedVolumeStats with total and per-DEX breakdown
         """
-        # Get all unique DEX IDs
+        cache_key = self._get_cache_key(user_id, "aggregated", period)
+
+        # Check cache first (AC#5)
+        if self._is_cache_valid(cache_key):
+            stats, _ = self._volume_cache[cache_key]
+            self._volume_cache.move_to_end(cache_key)
+            self._log.debug(
+                "Cache hit",
+                cache_key=cache_key,
+                volume_usd=str(stats.total_volume_usd),
+            )
+            return stats
+
+        # Bounds are computed once; every per-DEX entry and the totals share
+        # them, and end_dt doubles as the last_updated stamp.
         start_dt, end_dt = self._calculate_period_bounds(period)
 
+        # Summed as Decimal in Python: SQLite would sum in float64 (AC#4).
+        # Rows are streamed, so the sum runs while later chunks are fetched.
+        log = self._log.bind(user_id=user_id, period=period)
+        per_dex: dict[str, tuple[Decimal, int]] = {}
         async with self._session_factory() as session:
-            # Get distinct DEX IDs
-            dex_query = (
-                select(ExecutionModel.dex_id)
-                .where(
-                    and_(
-                        ExecutionModel.status.in_(["filled", "partial"]),
-                        ExecutionModel.created_at >= start_dt,
-                        ExecutionModel.created_at <= end_dt,
-                    )
-                )
-                .distinct()
+            rows = await session.stream(
+                _VOLUME_ORDERED_BY_DEX_QUERY,
+                {"start_dt": start_dt, "end_dt": end_dt},
             )
-            result = await session.execute(dex_query)
-            dex_ids = [row[0] for row in result.all()]
+            async for dex_id, execution_id, filled_size, fill_price in rows:
+                volume = _row_volume(log, execution_id, filled_size, fill_price)
+                if volume is None:
+                    continue
+                dex_volume, dex_count = per_dex.get(dex_id, (Decimal("0"), 0))
+                per_dex[dex_id] = (dex_volume + volume, dex_count + 1)
 
-        # Get stats for each DEX
         by_dex: dict[str, VolumeStats] = {}
         total_volume = Decimal("0")
         total_count = 0
 
-        for dex_id in dex_ids:
-            stats = await self.get_volume_stats(
-                user_id=user_id, dex_id=dex_id, period=period
+        for dex_id, (volume, count) in per_dex.items():
+            by_dex[dex_id] = VolumeStats(
+                dex_id=dex_id,
+                period=period,
+                volume_usd=volume,
+                execution_count=count,
+                last_updated=end_dt,
             )
-            by_dex[dex_id] = stats
-            total_volume += stats.volume_usd
-            total_count += stats.execution_count
+            total_volume += volume
+            total_count += count
 
-        now = datetime.now(timezone.utc)
-        return AggregatedVolumeStats(
+        stats = AggregatedVolumeStats(
             period=period,
             total_volume_usd=total_volume,
             total_execution_count=total_count,
             by_dex=by_dex,
-            last_updated=now,
+            last_updated=end_dt,
         )
 
+        # Cache the result (AC#5)
+        self._cache_store(self._volume_cache, cache_key, stats)
+
+        return stats
+
     def _get_exec_cache_key(
         self,
         user_id: int | None,
         period: TimePeriod,
-    ) -> str:
+    ) -> tuple:
         """Generate cache key for execution stats query (Story 5.3).
 
         Args:
@@ -333,11 +495,11 @@ class StatsService:
             period: Time period
 
         Returns:
-            Cache key string in format "exec:user_id:period"
+            Cache key tuple (user_id, period)
         """
-        return f"exec:{user_id or 'all'}:{period}"
+        return (user_id, period)
 
-    def _is_exec_cache_valid(self, key: str) -> bool:
+    def _is_exec_cache_valid(self, key: tuple) -> bool:
         """Check if execution stats cache entry is still valid.
 
         Args:
@@ -346,13 +508,10 @@ class StatsService:
         Returns:
             True if cache entry exists and is within TTL
         """
-        if not hasattr(self, "_exec_cache"):
-            self._exec_cache: dict[str, tuple] = {}
-        if key not in self._exec_cache:
+        entry = self._exec_cache.get(key)
+        if entry is None:
             return False
-        _, cached_at = self._exec_cache[key]
-        elapsed = (datetime.now(timezone.utc) - cached_at).total_seconds()
-        return elapsed < self._cache_ttl
+        return time.monotonic() - entry[1] < self._cache_ttl
 
     async def get_execution_stats(
         self,
@@ -371,17 +530,12 @@ class StatsService:
         Returns:
             ExecutionPeriodStats with total, successful, failed, partial, success_rate
         """
-        from kitkat.models import ExecutionPeriodStats
-
-        # Initialize cache if needed
-        if not hasattr(self, "_exec_cache"):
-            self._exec_cache: dict[str, tuple] = {}
-
         cache_key = self._get_exec_cache_key(user_id, period)
 
         # Check cache first (Task 4)
         if self._is_exec_cache_valid(cache_key):
             stats, _ = self._exec_cache[cache_key]
+            self._exec_cache.move_to_end(cache_key)
             self._log.debug("Execution stats cache hit", cache_key=cache_key)
             return stats
 
@@ -395,48 +549,20 @@ class StatsService:
         )
 
         async with self._session_factory() as session:
-            # Query all executions in period, excluding pending (AC#1)
-            query = select(ExecutionModel).where(
-                and_(
-                    ExecutionModel.status.in_(["filled", "partial", "failed"]),
-                    ExecutionModel.created_at >= start_dt,
-                    ExecutionModel.created_at <= end_dt,
-                )
-            )
-
+            # Count by status, excluding pending (AC#1) and test mode (AC#4)
+            query = _EXECUTION_COUNTS_QUERY
             if user_id:
                 query = query.where(ExecutionModel.user_id == user_id)
 
-            result = await session.execute(query)
-            executions = result.scalars().all()
-
-        # Count by status, excluding test mode (AC#3, AC#4)
-        successful = 0
-        partial = 0
-        failed = 0
-
-        for execution in executions:
-            # Parse result_data JSON (same pattern as get_volume_stats)
-            try:
-                if isinstance(execution.result_data, str):
-                    result_data = json.loads(execution.result_data)
-                else:
-                    result_data = execution.result_data or {}
-            except (json.JSONDecodeError, TypeError):
-                result_data = {}
-
-            # Exclude test mode executions (AC#4)
-            is_test_mode = result_data.get("is_test_mode", False)
-            if is_test_mode is True or is_test_mode == "true":
-                continue
-
-            if execution.status == "filled":
-                successful += 1
-            elif execution.status == "partial":
-                partial += 1
-            elif execution.status == "failed":
-                failed += 1
+            result = await session.execute(
+                query, {"start_dt": start_dt, "end_dt": end_dt}
+            )
+            counts = dict(result.all())
 
+        # Count by status (AC#3)
+        successful = counts.get("filled", 0)
+        partial = counts.get("partial", 0)
+        failed = counts.get("failed", 0)
         total = successful + partial + failed
 
         # Calculate success rate (AC#2, AC#3)
@@ -455,8 +581,7 @@ class StatsService:
         )
 
         # Cache the result (Task 4)
-        now = datetime.now(timezone.utc)
-        self._exec_cache[cache_key] = (stats, now)
+        self._cache_store(self._exec_cache, cache_key, stats)
 
         log.info(
             "Execution stats calculated",
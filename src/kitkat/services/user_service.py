@@ -1,7 +1,6 @@
 """User management service."""
 
 import json
-from hmac import compare_digest
 from typing import Optional
 
 import structlog
@@ -31,6 +30,9 @@ DEFAULT_USER_CONFIG = {
     "telegram_chat_id": None,
 }
 
+# Serialized once; every new user starts from the same default config
+_DEFAULT_USER_CONFIG_JSON = json.dumps(DEFAULT_USER_CONFIG)
+
 
 class UserService:
     """Service for user management operations."""
@@ -62,12 +64,11 @@ class UserService:
 
         # Generate unique webhook token (with retry for extremely rare token collision)
         webhook_token = generate_secure_token()
-        config_data = DEFAULT_USER_CONFIG.copy()
 
         user = UserModel(
             wallet_address=wallet_address,
             webhook_token=webhook_token,
-            config_data=json.dumps(config_data),
+            config_data=_DEFAULT_USER_CONFIG_JSON,
         )
         self.db.add(user)
         try:
@@ -85,7 +86,8 @@ class UserService:
                 return await self.create_user(wallet_address)
             else:
                 raise ValueError(f"Database error creating user: {wallet_address}")
-        await self.db.refresh(user)
+        # No refresh needed: the id comes back from the INSERT, all other
+        # columns have Python-side defaults, and sessions don't expire on commit.
 
         logger.info("User created for wallet", wallet_address=wallet_address)
         return User.model_validate(user)
@@ -0,0 +1,17 @@
+"""Shared fixtures for DEX adapter tests."""
+
+import pytest
+from tenacity import wait_none
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    """Disable tenacity backoff so retry paths run without real sleeps.
+
+    Patched per test via monkeypatch so the production wait policy is
+    restored afterwards rather than permanently mutated.
+    """
+    from kitkat.adapters.extended import ExtendedAdapter
+
+    for name in ("_submit_order", "_connect_websocket"):
+        monkeypatch.setattr(getattr(ExtendedAdapter, name).retry, "wait", wait_none())
@@ -5,14 +5,15 @@ graceful disconnection, order execution, and retry logic with exponential
 backoff per acceptance criteria.
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
-from tenacity import wait_none
 
 from kitkat.adapters.base import DEXAdapter
 from kitkat.adapters.exceptions import (
@@ -23,9 +24,14 @@ from kitkat.adapters.exceptions import (
     DEXRejectionError,
     DEXTimeoutError,
 )
+from kitkat.adapters.extended import HTTP_LIMITS, ExtendedAdapter, _to_decimal
 from kitkat.config import Settings
 from kitkat.models import HealthStatus, OrderStatus, OrderSubmissionResult, Position
 
+D0 = Decimal("0")
+D1 = Decimal("1.0")
+D_HALF = Decimal("0.5")
+
 # =============================================================================
 # Task 1 Tests: Extended adapter class skeleton
 # =============================================================================
@@ -36,35 +42,37 @@ class TestExtendedAdapterSkeleton:
 
     def test_extended_adapter_inherits_from_dex_adapter(self):
         """Subtask 1.1: ExtendedAdapter must inherit from DEXAdapter."""
-        from kitkat.adapters.extended import ExtendedAdapter
-
         assert issubclass(ExtendedAdapter, DEXAdapter)
 
+    def test_fake_settings_match_real_settings(self):
+        """FakeSettings only declares names that exist on Settings."""
+        for field in fields(FakeSettings):
+            assert field.name in Settings.model_fields or hasattr(
+                Settings, field.name
+            ), field.name
+
     def test_dex_id_returns_extended(self, extended_adapter):
         """Subtask 1.2: dex_id property must return 'extended'."""
         assert extended_adapter.dex_id == "extended"
 
     def test_init_creates_connection_state_tracking(self, extended_adapter):
         """Subtask 1.3: __init__ must set up connection state tracking."""
-        assert hasattr(extended_adapter, "_connected")
-        assert extended_adapter._connected is False
-        assert hasattr(extended_adapter, "_http_client")
-        assert extended_adapter._http_client is None
-        assert hasattr(extended_adapter, "_ws_connection")
-        assert extended_adapter._ws_connection is None
+        # Instance attributes, not class defaults; a missing key fails the test
+        state = vars(extended_adapter)
+        assert state["_connected"] is False
+        assert state["_http_client"] is None
+        assert state["_ws_connection"] is None
 
     def test_init_stores_settings(self, extended_adapter, mock_settings):
         """Subtask 1.3: __init__ must store settings reference."""
         assert extended_adapter._settings is mock_settings
 
-    @pytest.mark.asyncio
     async def test_disconnect_when_not_connected(self, extended_adapter):
         """Subtask 1.5: disconnect() must be safe when not connected."""
         # Should not raise - idempotent
         await extended_adapter.disconnect()
         assert extended_adapter._connected is False
 
-    @pytest.mark.asyncio
     async def test_disconnect_closes_http_client(self, connected_adapter):
         """Subtask 1.5: disconnect() must close HTTP client."""
         mock_client = connected_adapter._http_client
@@ -74,7 +82,6 @@ class TestExtendedAdapterSkeleton:
         assert connected_adapter._http_client is None
         assert connected_adapter._connected is False
 
-    @pytest.mark.asyncio
     async def test_disconnect_is_idempotent(self, connected_adapter):
         """Subtask 1.5: disconnect() must be safe to call multiple times."""
         await connected_adapter.disconnect()
@@ -90,130 +97,96 @@ class TestExtendedAdapterSkeleton:
 class TestHTTPConnection:
     """Tests for Task 2: HTTP connection and authentication (AC: #1, #3)."""
 
-    @pytest.mark.asyncio
-    async def test_connect_establishes_http_session(self, extended_adapter):
+    async def test_connect_establishes_http_session(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
         """Subtask 2.1: connect() must establish authenticated HTTP session."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            # Mock WebSocket connection
-            with patch(
-                "kitkat.adapters.extended.ExtendedAdapter._connect_websocket",
-                new_callable=AsyncMock,
-            ):
-                await extended_adapter.connect()
+        await extended_adapter.connect()
 
         assert extended_adapter._connected is True
         assert extended_adapter._http_client is not None
 
-    @pytest.mark.asyncio
     async def test_connect_includes_api_key_header(
-        self, extended_adapter, mock_settings
+        self,
+        extended_adapter,
+        mock_settings,
+        mock_httpx_client,
+        mock_websockets_connect,
     ):
         """Subtask 2.2: connect() must include API key in headers."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            with patch(
-                "kitkat.adapters.extended.ExtendedAdapter._connect_websocket",
-                new_callable=AsyncMock,
-            ):
-                await extended_adapter.connect()
-
-            # Verify headers were set correctly per Extended API docs
-            call_kwargs = mock_client_cls.call_args[1]
-            assert "headers" in call_kwargs
-            api_key = mock_settings.extended_api_key
-            assert call_kwargs["headers"]["X-Api-Key"] == api_key
-            assert "User-Agent" in call_kwargs["headers"]
-
-    @pytest.mark.asyncio
-    async def test_connect_verifies_credentials(self, extended_adapter):
+        mock_client_cls, _, _ = mock_httpx_client
+
+        await extended_adapter.connect()
+
+        # Verify headers were set correctly per Extended API docs
+        call_kwargs = mock_client_cls.call_args[1]
+        assert "headers" in call_kwargs
+        api_key = mock_settings.extended_api_key
+        assert call_kwargs["headers"]["X-Api-Key"] == api_key
+        assert "User-Agent" in call_kwargs["headers"]
+
+    async def test_connect_uses_pooled_client_limits(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
+        """connect() configures the shared client's keep-alive pool."""
+        mock_client_cls, _, _ = mock_httpx_client
+
+        await extended_adapter.connect()
+
+        assert mock_client_cls.call_args[1]["limits"] is HTTP_LIMITS
+
+    async def test_connect_verifies_credentials(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
         """Subtask 2.3: connect() must verify credentials with API call."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            with patch(
-                "kitkat.adapters.extended.ExtendedAdapter._connect_websocket",
-                new_callable=AsyncMock,
-            ):
-                await extended_adapter.connect()
-
-            # Verify positions endpoint was called (Extended has no /health)
-            mock_client.get.assert_called_with("/user/positions")
-
-    @pytest.mark.asyncio
-    async def test_connect_raises_on_invalid_credentials(self, extended_adapter):
+        _, mock_client, _ = mock_httpx_client
+
+        await extended_adapter.connect()
+
+        # Verify positions endpoint was called (Extended has no /health)
+        mock_client.get.assert_called_with("/user/positions")
+
+    async def test_connect_raises_on_invalid_credentials(
+        self, extended_adapter, mock_httpx_client
+    ):
         """Subtask 2.4: connect() must raise DEXConnectionError on auth failure."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 401
-            mock_client.get = AsyncMock(
-                side_effect=httpx.HTTPStatusError(
-                    "Unauthorized",
-                    request=MagicMock(),
-                    response=mock_response,
-                )
-            )
-            mock_client_cls.return_value = mock_client
+        _, mock_client, mock_response = mock_httpx_client
+        mock_response.status_code = 401
+        mock_client.get.side_effect = httpx.HTTPStatusError(
+            "Unauthorized",
+            request=FAKE_REQUEST,
+            response=mock_response,
+        )
 
-            with pytest.raises(DEXConnectionError) as exc_info:
-                await extended_adapter.connect()
+        with pytest.raises(DEXConnectionError) as exc_info:
+            await extended_adapter.connect()
 
-            assert "Failed to connect" in str(exc_info.value)
+        assert "Failed to connect" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_connect_raises_on_network_error(self, extended_adapter):
+    async def test_connect_raises_on_network_error(
+        self, extended_adapter, mock_httpx_client
+    ):
         """Subtask 2.4: connect() must raise DEXConnectionError on network error."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(
-                side_effect=httpx.ConnectError("Connection refused")
-            )
-            mock_client_cls.return_value = mock_client
+        _, mock_client, _ = mock_httpx_client
+        mock_client.get.side_effect = httpx.ConnectError("Connection refused")
 
-            with pytest.raises(DEXConnectionError) as exc_info:
-                await extended_adapter.connect()
+        with pytest.raises(DEXConnectionError) as exc_info:
+            await extended_adapter.connect()
 
-            assert "Failed to connect" in str(exc_info.value)
+        assert "Failed to connect" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_connect_stores_connection_timestamp(self, extended_adapter):
+    async def test_connect_stores_connection_timestamp(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect, monkeypatch
+    ):
         """Subtask 2.5: connect() must store connection timestamp."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            with patch(
-                "kitkat.adapters.extended.ExtendedAdapter._connect_websocket",
-                new_callable=AsyncMock,
-            ):
-                before = datetime.now(timezone.utc)
-                await extended_adapter.connect()
-                after = datetime.now(timezone.utc)
-
-            assert hasattr(extended_adapter, "_connected_at")
-            assert before <= extended_adapter._connected_at <= after
+        fixed_ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        frozen_datetime = MagicMock(wraps=datetime)
+        frozen_datetime.now.return_value = fixed_ts
+        monkeypatch.setattr("kitkat.adapters.extended.datetime", frozen_datetime)
+
+        await extended_adapter.connect()
+
+        assert extended_adapter._connected_at == fixed_ts
 
 
 # =============================================================================
@@ -224,41 +197,72 @@ class TestHTTPConnection:
 class TestWebSocketConnection:
     """Tests for Task 3: WebSocket connection (AC: #2, #4)."""
 
-    @pytest.mark.asyncio
-    async def test_connect_establishes_websocket(self, extended_adapter):
+    async def test_connect_establishes_websocket(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
         """Subtask 3.2: connect() must establish WebSocket connection."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            with patch("websockets.connect", new_callable=AsyncMock) as mock_ws_connect:
-                mock_ws = AsyncMock()
-                mock_ws_connect.return_value = mock_ws
+        await extended_adapter.connect()
 
-                await extended_adapter.connect()
+        mock_websockets_connect.assert_called_once()
+        assert extended_adapter._ws_connection is not None
 
-                mock_ws_connect.assert_called_once()
-                assert extended_adapter._ws_connection is not None
-
-    @pytest.mark.asyncio
-    async def test_disconnect_closes_websocket(self, connected_adapter_with_ws):
+    async def test_disconnect_closes_websocket(self, connected_adapter):
         """Subtask 3.1: disconnect() must close WebSocket connection."""
-        mock_ws = connected_adapter_with_ws._ws_connection
-        await connected_adapter_with_ws.disconnect()
+        mock_ws = connected_adapter._ws_connection
+        await connected_adapter.disconnect()
 
         mock_ws.close.assert_called_once()
-        assert connected_adapter_with_ws._ws_connection is None
+        assert connected_adapter._ws_connection is None
+
+    async def test_connect_overlaps_credential_check_and_websocket(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
+        """connect() starts the WebSocket handshake before credentials return."""
+        _, mock_client, mock_response = mock_httpx_client
+        ws_started = asyncio.Event()
+
+        async def get_after_ws_started(url):
+            await ws_started.wait()
+            return mock_response
+
+        async def connect_ws(*args, **kwargs):
+            ws_started.set()
+            return AsyncMock()
+
+        mock_client.get.side_effect = get_after_ws_started
+        mock_websockets_connect.side_effect = connect_ws
+
+        # Sequential steps would deadlock here: the GET waits on the handshake
+        await asyncio.wait_for(extended_adapter.connect(), timeout=1)
+
+        assert extended_adapter.is_connected
+
+    async def test_auth_failure_closes_concurrent_websocket(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
+        """A WebSocket opened alongside a failed credential check is closed."""
+        _, mock_client, mock_response = mock_httpx_client
+        mock_ws = mock_websockets_connect.return_value
+
+        async def unauthorized(url):
+            await asyncio.sleep(0)
+            mock_response.status_code = 401
+            raise httpx.HTTPStatusError(
+                "Unauthorized", request=FAKE_REQUEST, response=mock_response
+            )
+
+        mock_client.get.side_effect = unauthorized
+
+        with pytest.raises(DEXConnectionError, match="auth failed"):
+            await extended_adapter.connect()
+
+        mock_ws.close.assert_awaited_once()
+        assert extended_adapter._ws_connection is None
+        assert extended_adapter._http_client is None
 
-    @pytest.mark.asyncio
-    async def test_websocket_reconnection_uses_backoff(self, extended_adapter):
+    def test_websocket_reconnection_uses_backoff(self):
         """Subtask 3.4: WebSocket reconnection uses exponential backoff."""
         # This tests the retry decorator configuration
-        from kitkat.adapters.extended import ExtendedAdapter
-
         # Check that _connect_websocket has retry decorator
         method = getattr(ExtendedAdapter, "_connect_websocket", None)
         assert method is not None
@@ -274,11 +278,9 @@ class TestWebSocketConnection:
 class TestHealthCheck:
     """Tests for Task 4: Health check (AC: #5)."""
 
-    @pytest.mark.asyncio
     async def test_get_health_status_returns_healthy(self, connected_adapter):
         """Subtask 4.1, 4.3: get_health_status() returns healthy on 200."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = make_response(200)
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         status = await connected_adapter.get_health_status()
@@ -289,18 +291,15 @@ class TestHealthCheck:
         assert status.connected is True
         assert status.error_message is None
 
-    @pytest.mark.asyncio
     async def test_get_health_status_measures_latency(self, connected_adapter):
         """Subtask 4.2: get_health_status() measures response latency."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = make_response(200)
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         status = await connected_adapter.get_health_status()
 
         assert status.latency_ms >= 0
 
-    @pytest.mark.asyncio
     async def test_get_health_status_degraded_on_timeout(self, connected_adapter):
         """Subtask 4.4: get_health_status() returns degraded on timeout."""
         connected_adapter._http_client.get = AsyncMock(
@@ -312,7 +311,6 @@ class TestHealthCheck:
         assert status.status == "degraded"
         assert "timed out" in status.error_message.lower()
 
-    @pytest.mark.asyncio
     async def test_get_health_status_returns_offline_on_connection_error(
         self, connected_adapter
     ):
@@ -326,18 +324,68 @@ class TestHealthCheck:
         assert status.status == "offline"
         assert status.connected is False
 
-    @pytest.mark.asyncio
     async def test_get_health_status_stores_last_check(self, connected_adapter):
         """Subtask 4.5: get_health_status() stores last_check timestamp."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = make_response(200)
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
-        before = datetime.now(timezone.utc)
         status = await connected_adapter.get_health_status()
-        after = datetime.now(timezone.utc)
 
-        assert before <= status.last_check <= after
+        assert isinstance(status.last_check, datetime)
+        age = datetime.now(timezone.utc) - status.last_check
+        assert 0 <= age.total_seconds() < 1
+
+    async def test_get_health_status_reuses_recent_healthy_result(
+        self, connected_adapter
+    ):
+        """A healthy result is served from cache within the TTL."""
+        mock_response = make_response(200)
+        connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
+
+        first = await connected_adapter.get_health_status()
+        second = await connected_adapter.get_health_status()
+
+        assert second is first
+        connected_adapter._http_client.get.assert_awaited_once()
+
+    async def test_get_health_status_reprobes_after_ttl(
+        self, connected_adapter, monkeypatch
+    ):
+        """The cached result expires after HEALTH_CACHE_TTL_SECONDS."""
+        mock_response = make_response(200)
+        connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
+
+        await connected_adapter.get_health_status()
+        monkeypatch.setattr(
+            "kitkat.adapters.extended.HEALTH_CACHE_TTL_SECONDS", 0.0
+        )
+        await connected_adapter.get_health_status()
+
+        assert connected_adapter._http_client.get.await_count == 2
+
+    async def test_get_health_status_does_not_cache_unhealthy(
+        self, connected_adapter
+    ):
+        """Degraded or offline results are never reused."""
+        connected_adapter._http_client.get = AsyncMock(
+            side_effect=httpx.TimeoutException("Timeout")
+        )
+
+        await connected_adapter.get_health_status()
+        await connected_adapter.get_health_status()
+
+        assert connected_adapter._http_client.get.await_count == 2
+
+    async def test_disconnect_clears_health_cache(self, connected_adapter):
+        """disconnect() drops the cached health result."""
+        mock_response = make_response(200)
+        connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
+        await connected_adapter.get_health_status()
+
+        await connected_adapter.disconnect()
+        status = await connected_adapter.get_health_status()
+
+        assert status.status == "offline"
 
 
 # =============================================================================
@@ -352,26 +400,14 @@ class TestConnectionStateTracking:
         """Adapter starts in disconnected state."""
         assert extended_adapter._connected is False
 
-    @pytest.mark.asyncio
-    async def test_connect_sets_connected_true(self, extended_adapter):
+    async def test_connect_sets_connected_true(
+        self, extended_adapter, mock_httpx_client, mock_websockets_connect
+    ):
         """connect() sets _connected to True."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            with patch(
-                "kitkat.adapters.extended.ExtendedAdapter._connect_websocket",
-                new_callable=AsyncMock,
-            ):
-                await extended_adapter.connect()
+        await extended_adapter.connect()
 
         assert extended_adapter._connected is True
 
-    @pytest.mark.asyncio
     async def test_disconnect_sets_connected_false(self, connected_adapter):
         """disconnect() sets _connected to False."""
         await connected_adapter.disconnect()
@@ -383,50 +419,110 @@ class TestConnectionStateTracking:
 # =============================================================================
 
 
-@pytest.fixture
+# Placeholder request attached to fake responses (needed by raise_for_status)
+FAKE_REQUEST = httpx.Request("GET", "https://api.test/api/v1")
+
+
+def make_response(status_code, payload=None):
+    """Build a real httpx.Response, with a JSON body when payload is given."""
+    return httpx.Response(status_code, json=payload, request=FAKE_REQUEST)
+
+
+def build_httpx_mock(status_code=200, side_effect=None):
+    """Build a mocked httpx.AsyncClient and the response its GET returns.
+
+    The one place client mocks are assembled; fixtures and tests needing a
+    failing GET pass ``side_effect`` instead of rewiring the mock.
+    """
+    mock_response = make_response(status_code)
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=mock_response, side_effect=side_effect)
+    return mock_client, mock_response
+
+
+def counting_post(outcome):
+    """Build a plain async post that raises or returns ``outcome`` every call.
+
+    Cheaper than AsyncMock on the retry path. Returns (post, calls); calls
+    collects the kwargs of each call for counting.
+    """
+    calls = []
+
+    async def post(url, **kwargs):
+        calls.append(kwargs)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return post, calls
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSettings:
+    """Read-only stand-in for the Settings fields ExtendedAdapter uses."""
+
+    extended_api_key: str = "test-api-key"
+    extended_api_secret: str = "test-api-secret"
+    extended_stark_private_key: str = "test-stark-key"
+    extended_account_address: str = "0x123"
+    extended_network: str = "testnet"
+    # Properties on Settings, derived from the network there
+    extended_api_base_url: str = (
+        "https://api.starknet.sepolia.extended.exchange/api/v1"
+    )
+    extended_ws_url: str = (
+        "wss://starknet.sepolia.extended.exchange/stream.extended.exchange/v1"
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Create mock settings for testing per Extended API docs."""
-    settings = MagicMock(spec=Settings)
-    settings.extended_api_key = "test-api-key"
-    settings.extended_api_secret = "test-api-secret"
-    settings.extended_stark_private_key = "test-stark-key"
-    settings.extended_account_address = "0x123"
-    settings.extended_network = "testnet"
-    # Properties return correct URLs based on network
-    settings.extended_api_base_url = "https://api.starknet.sepolia.extended.exchange/api/v1"
-    settings.extended_ws_url = "wss://starknet.sepolia.extended.exchange/stream.extended.exchange/v1"
-    return settings
+    """Create settings for testing per Extended API docs.
+
+    Session-scoped: the frozen dataclass cannot be mutated by a test, so one
+    instance is safely shared. Use dataclasses.replace() for variations.
+    """
+    return FakeSettings()
 
 
 @pytest.fixture
 def extended_adapter(mock_settings):
     """Create ExtendedAdapter instance for testing."""
-    from kitkat.adapters.extended import ExtendedAdapter
-
     return ExtendedAdapter(mock_settings)
 
 
 @pytest.fixture
-def connected_adapter(mock_settings):
-    """Create ExtendedAdapter in connected state with mocked HTTP client."""
-    from kitkat.adapters.extended import ExtendedAdapter
+def mock_httpx_client(monkeypatch):
+    """Patch httpx.AsyncClient with a client whose GET returns a 200 response.
+
+    Returns (mock_client_cls, mock_client, mock_response); tests override only
+    the field they exercise, e.g. ``mock_client.get.side_effect``.
+    """
+    mock_client, mock_response = build_httpx_mock()
+    mock_client_cls = MagicMock(return_value=mock_client)
+    monkeypatch.setattr(httpx, "AsyncClient", mock_client_cls)
+    return mock_client_cls, mock_client, mock_response
 
+
+@pytest.fixture
+def mock_websockets_connect():
+    """Patch websockets.connect to return a mocked WebSocket connection."""
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_ws_connect:
+        mock_ws_connect.return_value = AsyncMock()
+        yield mock_ws_connect
+
+
+@pytest.fixture
+def connected_adapter(mock_settings):
+    """Create ExtendedAdapter in connected state with mocked HTTP and WebSocket."""
     adapter = ExtendedAdapter(mock_settings)
     adapter._connected = True
     adapter._connected_at = datetime.now(timezone.utc)
-    adapter._http_client = AsyncMock()
-    adapter._http_client.aclose = AsyncMock()
+    adapter._http_client, _ = build_httpx_mock()
+    adapter._ws_connection = AsyncMock()
     return adapter
 
 
-@pytest.fixture
-def connected_adapter_with_ws(connected_adapter):
-    """Create connected adapter with mocked WebSocket."""
-    connected_adapter._ws_connection = AsyncMock()
-    connected_adapter._ws_connection.close = AsyncMock()
-    return connected_adapter
-
-
 # =============================================================================
 # Story 2.6 Tests: Order Execution
 # =============================================================================
@@ -435,78 +531,74 @@ def connected_adapter_with_ws(connected_adapter):
 class TestExecuteOrder:
     """Tests for Task 1: execute_order() method (AC: #1, #2, #3, #4)."""
 
-    @pytest.mark.asyncio
     async def test_execute_order_buy_success(self, connected_adapter):
         """Subtask 5.1: Test successful buy (long) order execution."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_123",
-            "status": "PENDING",
-            "created_at": "2026-01-26T10:00:00Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_123",
+                "status": "PENDING",
+                "created_at": "2026-01-26T10:00:00Z",
+            },
+        )
         connected_adapter._http_client.post = AsyncMock(return_value=mock_response)
 
-        result = await connected_adapter.execute_order(
-            "ETH-PERP", "buy", Decimal("1.0")
-        )
+        result = await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
         assert isinstance(result, OrderSubmissionResult)
         assert result.order_id == "ord_123"
         assert result.status == "submitted"
-        assert result.filled_amount == Decimal("0")
+        assert result.filled_amount == D0
         connected_adapter._http_client.post.assert_called_once()
         call_args = connected_adapter._http_client.post.call_args
         assert call_args[0][0] == "/user/order"
         assert call_args[1]["json"]["side"] == "BUY"
         assert call_args[1]["json"]["symbol"] == "ETH-PERP"
 
-    @pytest.mark.asyncio
     async def test_execute_order_sell_success(self, connected_adapter):
         """Subtask 5.2: Test successful sell (short) order execution."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_456",
-            "status": "PENDING",
-            "created_at": "2026-01-26T10:00:00Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_456",
+                "status": "PENDING",
+                "created_at": "2026-01-26T10:00:00Z",
+            },
+        )
         connected_adapter._http_client.post = AsyncMock(return_value=mock_response)
 
-        result = await connected_adapter.execute_order(
-            "BTC-PERP", "sell", Decimal("0.5")
-        )
+        result = await connected_adapter.execute_order("BTC-PERP", "sell", D_HALF)
 
         assert result.order_id == "ord_456"
         assert result.status == "submitted"
         call_args = connected_adapter._http_client.post.call_args
         assert call_args[1]["json"]["side"] == "SELL"
 
-    @pytest.mark.asyncio
     async def test_execute_order_rejection_error(self, connected_adapter):
         """Subtask 5.3: Test order rejection handling (invalid symbol)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "error": "INVALID_SYMBOL",
-            "message": "Symbol INVALID-PAIR not found",
-        }
+        mock_response = make_response(
+            400,
+            {
+                "error": "INVALID_SYMBOL",
+                "message": "Symbol INVALID-PAIR not found",
+            },
+        )
         connected_adapter._http_client.post = AsyncMock(return_value=mock_response)
 
         with pytest.raises(DEXRejectionError) as exc_info:
-            await connected_adapter.execute_order("INVALID-PAIR", "buy", Decimal("1.0"))
+            await connected_adapter.execute_order("INVALID-PAIR", "buy", D1)
 
         assert "Symbol INVALID-PAIR not found" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_execute_order_insufficient_funds(self, connected_adapter):
         """Subtask 5.4: Test insufficient funds error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "error": "INSUFFICIENT_MARGIN",
-            "message": "Not enough margin for order",
-        }
+        mock_response = make_response(
+            400,
+            {
+                "error": "INSUFFICIENT_MARGIN",
+                "message": "Not enough margin for order",
+            },
+        )
         connected_adapter._http_client.post = AsyncMock(return_value=mock_response)
 
         with pytest.raises(DEXInsufficientFundsError) as exc_info:
@@ -514,65 +606,58 @@ class TestExecuteOrder:
 
         assert "Not enough margin" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_execute_order_not_connected(self, extended_adapter):
         """Test execute_order raises non-retryable error when not connected."""
         with pytest.raises(DEXError) as exc_info:
-            await extended_adapter.execute_order("ETH-PERP", "buy", Decimal("1.0"))
+            await extended_adapter.execute_order("ETH-PERP", "buy", D1)
 
         assert "Not connected" in str(exc_info.value)
         # Must NOT be DEXConnectionError (which would trigger retry)
         assert type(exc_info.value) is DEXError
 
-    @pytest.mark.asyncio
     async def test_execute_order_timeout(self, connected_adapter):
         """Subtask 5.10: Test connection/timeout error handling."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=httpx.TimeoutException("Request timed out")
+        connected_adapter._http_client.post, calls = counting_post(
+            httpx.TimeoutException("Request timed out")
         )
 
         with pytest.raises(DEXTimeoutError) as exc_info:
-            await connected_adapter.execute_order("ETH-PERP", "buy", Decimal("1.0"))
+            await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
         assert "timed out" in str(exc_info.value).lower()
         # Retries exhausted: 1 initial + 3 retries
-        assert connected_adapter._http_client.post.call_count == 4
+        assert len(calls) == 4
 
-    @pytest.mark.asyncio
     async def test_execute_order_connection_error(self, connected_adapter):
         """Test network error handling in execute_order."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=httpx.ConnectError("Connection refused")
+        connected_adapter._http_client.post, calls = counting_post(
+            httpx.ConnectError("Connection refused")
         )
 
         with pytest.raises(DEXConnectionError) as exc_info:
-            await connected_adapter.execute_order("ETH-PERP", "buy", Decimal("1.0"))
+            await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
         assert "failed" in str(exc_info.value).lower()
         # Retries exhausted: 1 initial + 3 retries
-        assert connected_adapter._http_client.post.call_count == 4
+        assert len(calls) == 4
 
 
 class TestGetOrderStatus:
     """Tests for Task 2: get_order_status() method (AC: #5)."""
 
-    @pytest.mark.asyncio
     async def test_get_order_status_filled(self, connected_adapter):
         """Subtask 5.5: Test get_order_status for filled state."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_123",
-            "status": "FILLED",
-            "filled_amount": "1.0",
-            "remaining_amount": "0.0",
-            "average_price": "2495.50",
-            "updated_at": "2026-01-26T10:00:05Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_123",
+                "status": "FILLED",
+                "filled_amount": "1.0",
+                "remaining_amount": "0.0",
+                "average_price": "2495.50",
+                "updated_at": "2026-01-26T10:00:05Z",
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         status = await connected_adapter.get_order_status("ord_123")
@@ -580,63 +665,63 @@ class TestGetOrderStatus:
         assert isinstance(status, OrderStatus)
         assert status.order_id == "ord_123"
         assert status.status == "filled"
-        assert status.filled_amount == Decimal("1.0")
+        assert status.filled_amount == D1
         assert status.remaining_amount == Decimal("0.0")
         assert status.average_price == Decimal("2495.50")
 
-    @pytest.mark.asyncio
     async def test_get_order_status_pending(self, connected_adapter):
         """Test get_order_status for pending state."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_456",
-            "status": "PENDING",
-            "filled_amount": "0.0",
-            "remaining_amount": "1.0",
-            "average_price": "0.0",
-            "updated_at": "2026-01-26T10:00:00Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_456",
+                "status": "PENDING",
+                "filled_amount": "0.0",
+                "remaining_amount": "1.0",
+                "average_price": "0.0",
+                "updated_at": "2026-01-26T10:00:00Z",
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         status = await connected_adapter.get_order_status("ord_456")
 
         assert status.status == "pending"
-        assert status.remaining_amount == Decimal("1.0")
+        assert status.remaining_amount == D1
 
-    @pytest.mark.asyncio
     async def test_get_order_status_partial(self, connected_adapter):
         """Test get_order_status for partial fill state."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_789",
-            "status": "PARTIAL_FILL",
-            "filled_amount": "0.5",
-            "remaining_amount": "0.5",
-            "average_price": "2500.00",
-            "updated_at": "2026-01-26T10:00:03Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_789",
+                "status": "PARTIAL_FILL",
+                "filled_amount": "0.5",
+                "remaining_amount": "0.5",
+                "average_price": "2500.00",
+                "updated_at": "2026-01-26T10:00:03Z",
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         status = await connected_adapter.get_order_status("ord_789")
 
         assert status.status == "partial"
-        assert status.filled_amount == Decimal("0.5")
+        assert status.filled_amount == D_HALF
 
-    @pytest.mark.asyncio
     async def test_get_order_status_cancelled(self, connected_adapter):
         """Test get_order_status for cancelled state."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_cancel",
-            "status": "CANCELLED",
-            "filled_amount": "0.0",
-            "remaining_amount": "1.0",
-            "average_price": "0.0",
-            "updated_at": "2026-01-26T10:00:10Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_cancel",
+                "status": "CANCELLED",
+                "filled_amount": "0.0",
+                "remaining_amount": "1.0",
+                "average_price": "0.0",
+                "updated_at": "2026-01-26T10:00:10Z",
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(
             return_value=mock_response
         )
@@ -646,19 +731,19 @@ class TestGetOrderStatus:
         assert status.status == "cancelled"
         assert status.filled_amount == Decimal("0.0")
 
-    @pytest.mark.asyncio
     async def test_get_order_status_rejected(self, connected_adapter):
         """Test get_order_status for rejected (failed) state."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_reject",
-            "status": "REJECTED",
-            "filled_amount": "0.0",
-            "remaining_amount": "1.0",
-            "average_price": "0.0",
-            "updated_at": "2026-01-26T10:00:12Z",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_reject",
+                "status": "REJECTED",
+                "filled_amount": "0.0",
+                "remaining_amount": "1.0",
+                "average_price": "0.0",
+                "updated_at": "2026-01-26T10:00:12Z",
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(
             return_value=mock_response
         )
@@ -667,21 +752,20 @@ class TestGetOrderStatus:
 
         assert status.status == "failed"
 
-    @pytest.mark.asyncio
     async def test_get_order_status_not_found(self, connected_adapter):
         """Test get_order_status with non-existent order."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {
-            "error": "ORDER_NOT_FOUND",
-            "message": "Order not found",
-        }
+        mock_response = make_response(
+            404,
+            {
+                "error": "ORDER_NOT_FOUND",
+                "message": "Order not found",
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         with pytest.raises(DEXOrderNotFoundError):
             await connected_adapter.get_order_status("nonexistent")
 
-    @pytest.mark.asyncio
     async def test_get_order_status_timeout(self, connected_adapter):
         """Test get_order_status timeout handling."""
         connected_adapter._http_client.get = AsyncMock(
@@ -691,7 +775,6 @@ class TestGetOrderStatus:
         with pytest.raises(DEXTimeoutError):
             await connected_adapter.get_order_status("ord_123")
 
-    @pytest.mark.asyncio
     async def test_get_order_status_not_connected(self, extended_adapter):
         """Test get_order_status raises when not connected."""
         with pytest.raises(DEXConnectionError) as exc_info:
@@ -703,23 +786,23 @@ class TestGetOrderStatus:
 class TestGetPosition:
     """Tests for Task 3: get_position() method (AC: #6)."""
 
-    @pytest.mark.asyncio
     async def test_get_position_exists(self, connected_adapter):
         """Subtask 5.6: Test get_position with existing position."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "positions": [
-                {
-                    "symbol": "ETH-PERP",
-                    "size": "2.5",
-                    "side": "LONG",
-                    "entry_price": "2480.00",
-                    "mark_price": "2510.00",
-                    "unrealized_pnl": "75.00",
-                }
-            ]
-        }
+        mock_response = make_response(
+            200,
+            {
+                "positions": [
+                    {
+                        "symbol": "ETH-PERP",
+                        "size": "2.5",
+                        "side": "LONG",
+                        "entry_price": "2480.00",
+                        "mark_price": "2510.00",
+                        "unrealized_pnl": "75.00",
+                    }
+                ]
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         position = await connected_adapter.get_position("ETH-PERP")
@@ -732,43 +815,40 @@ class TestGetPosition:
         assert position.current_price == Decimal("2510.00")
         assert position.unrealized_pnl == Decimal("75.00")
 
-    @pytest.mark.asyncio
     async def test_get_position_none(self, connected_adapter):
         """Subtask 5.7: Test get_position with no position (returns None)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"positions": []}
+        mock_response = make_response(200, {"positions": []})
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         position = await connected_adapter.get_position("BTC-PERP")
 
         assert position is None
 
-    @pytest.mark.asyncio
     async def test_get_position_filters_by_symbol(self, connected_adapter):
         """Test get_position returns correct position when multiple exist."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "positions": [
-                {
-                    "symbol": "ETH-PERP",
-                    "size": "1.0",
-                    "side": "LONG",
-                    "entry_price": "2400.00",
-                    "mark_price": "2450.00",
-                    "unrealized_pnl": "50.00",
-                },
-                {
-                    "symbol": "BTC-PERP",
-                    "size": "0.1",
-                    "side": "SHORT",
-                    "entry_price": "45000.00",
-                    "mark_price": "44000.00",
-                    "unrealized_pnl": "100.00",
-                },
-            ]
-        }
+        mock_response = make_response(
+            200,
+            {
+                "positions": [
+                    {
+                        "symbol": "ETH-PERP",
+                        "size": "1.0",
+                        "side": "LONG",
+                        "entry_price": "2400.00",
+                        "mark_price": "2450.00",
+                        "unrealized_pnl": "50.00",
+                    },
+                    {
+                        "symbol": "BTC-PERP",
+                        "size": "0.1",
+                        "side": "SHORT",
+                        "entry_price": "45000.00",
+                        "mark_price": "44000.00",
+                        "unrealized_pnl": "100.00",
+                    },
+                ]
+            },
+        )
         connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
 
         position = await connected_adapter.get_position("BTC-PERP")
@@ -777,7 +857,74 @@ class TestGetPosition:
         assert position.symbol == "BTC-PERP"
         assert position.size == Decimal("0.1")
 
-    @pytest.mark.asyncio
+    async def test_get_position_reuses_recent_positions(self, connected_adapter):
+        """Lookups within the TTL share one positions fetch."""
+        mock_response = make_response(
+            200,
+            {
+                "positions": [
+                    {
+                        "symbol": "ETH-PERP",
+                        "size": "1.0",
+                        "side": "LONG",
+                        "entry_price": "2400.00",
+                        "mark_price": "2450.00",
+                        "unrealized_pnl": "50.00",
+                    },
+                ]
+            },
+        )
+        connected_adapter._http_client.get = AsyncMock(return_value=mock_response)
+
+        eth = await connected_adapter.get_position("ETH-PERP")
+        btc = await connected_adapter.get_position("BTC-PERP")
+
+        assert eth is not None
+        assert btc is None
+        connected_adapter._http_client.get.assert_awaited_once()
+
+    async def test_execute_order_invalidates_positions_cache(self, connected_adapter):
+        """Submitting an order forces the next lookup to refetch positions."""
+        connected_adapter._http_client.get = AsyncMock(
+            return_value=make_response(200, {"positions": []})
+        )
+        connected_adapter._http_client.post = AsyncMock(
+            return_value=make_response(200, {"order_id": "ord_1"})
+        )
+
+        await connected_adapter.get_position("ETH-PERP")
+        await connected_adapter.execute_order("ETH-PERP", "buy", D1)
+        await connected_adapter.get_position("ETH-PERP")
+
+        assert connected_adapter._http_client.get.await_count == 2
+
+    async def test_positions_fetched_during_order_are_not_cached(
+        self, connected_adapter
+    ):
+        """A fetch that overlaps an order submission does not fill the cache."""
+        fetch_started = asyncio.Event()
+        release_fetch = asyncio.Event()
+
+        async def slow_get(url):
+            fetch_started.set()
+            await release_fetch.wait()
+            return make_response(200, {"positions": []})
+
+        connected_adapter._http_client.get = AsyncMock(side_effect=slow_get)
+        connected_adapter._http_client.post = AsyncMock(
+            return_value=make_response(200, {"order_id": "ord_1"})
+        )
+
+        lookup = asyncio.create_task(connected_adapter.get_position("ETH-PERP"))
+        await fetch_started.wait()
+        await connected_adapter.execute_order("ETH-PERP", "buy", D1)
+        release_fetch.set()
+        await lookup
+
+        assert connected_adapter._positions_cache is None
+        await connected_adapter.get_position("ETH-PERP")
+        assert connected_adapter._http_client.get.await_count == 2
+
     async def test_get_position_not_connected(self, extended_adapter):
         """Test get_position raises when not connected."""
         with pytest.raises(DEXConnectionError) as exc_info:
@@ -785,7 +932,6 @@ class TestGetPosition:
 
         assert "Not connected" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_get_position_timeout(self, connected_adapter):
         """Test get_position timeout handling."""
         connected_adapter._http_client.get = AsyncMock(
@@ -799,15 +945,15 @@ class TestGetPosition:
 class TestCancelOrder:
     """Tests for Task 4: cancel_order() method (AC: #7)."""
 
-    @pytest.mark.asyncio
     async def test_cancel_order_success(self, connected_adapter):
         """Subtask 5.8: Test cancel_order success."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "order_id": "ord_123",
-            "status": "CANCELLED",
-        }
+        mock_response = make_response(
+            200,
+            {
+                "order_id": "ord_123",
+                "status": "CANCELLED",
+            },
+        )
         connected_adapter._http_client.delete = AsyncMock(return_value=mock_response)
 
         # Should not raise
@@ -815,15 +961,15 @@ class TestCancelOrder:
 
         connected_adapter._http_client.delete.assert_called_once_with("/user/orders/ord_123")
 
-    @pytest.mark.asyncio
     async def test_cancel_order_already_filled(self, connected_adapter):
         """Subtask 5.9: Test cancel_order with already filled order."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {
-            "error": "ORDER_NOT_FOUND",
-            "message": "Order not found or already filled",
-        }
+        mock_response = make_response(
+            404,
+            {
+                "error": "ORDER_NOT_FOUND",
+                "message": "Order not found or already filled",
+            },
+        )
         connected_adapter._http_client.delete = AsyncMock(return_value=mock_response)
 
         with pytest.raises(DEXOrderNotFoundError) as exc_info:
@@ -831,7 +977,6 @@ class TestCancelOrder:
 
         assert "already filled" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_cancel_order_not_connected(self, extended_adapter):
         """Test cancel_order raises when not connected."""
         with pytest.raises(DEXConnectionError) as exc_info:
@@ -839,7 +984,6 @@ class TestCancelOrder:
 
         assert "Not connected" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_cancel_order_timeout(self, connected_adapter):
         """Test cancel_order timeout handling."""
         connected_adapter._http_client.delete = AsyncMock(
@@ -861,6 +1005,12 @@ class TestNonceGeneration:
             assert nonce not in nonces
             nonces.add(nonce)
 
+    def test_nonce_is_strictly_increasing(self, connected_adapter):
+        """Nonces keep increasing even when calls share a clock tick."""
+        nonces = [connected_adapter._generate_nonce() for _ in range(100)]
+        assert nonces == sorted(nonces)
+        assert len(set(nonces)) == len(nonces)
+
     def test_nonce_is_positive_integer(self, connected_adapter):
         """Test that nonce is a positive integer."""
         nonce = connected_adapter._generate_nonce()
@@ -874,156 +1024,98 @@ class TestSignatureCreation:
     def test_signature_is_hex_string(self, connected_adapter):
         """Test that signature is a hex string starting with 0x."""
         signature = connected_adapter._create_order_signature(
-            "ETH-PERP", "BUY", Decimal("1.0"), 12345
+            "ETH-PERP", "BUY", D1, 12345
         )
         assert signature.startswith("0x")
         assert len(signature) == 66  # 0x + 64 hex chars
 
     def test_signature_is_deterministic(self, connected_adapter):
         """Test that same inputs produce same signature."""
-        sig1 = connected_adapter._create_order_signature(
-            "ETH-PERP", "BUY", Decimal("1.0"), 12345
-        )
-        sig2 = connected_adapter._create_order_signature(
-            "ETH-PERP", "BUY", Decimal("1.0"), 12345
-        )
+        sig1 = connected_adapter._create_order_signature("ETH-PERP", "BUY", D1, 12345)
+        sig2 = connected_adapter._create_order_signature("ETH-PERP", "BUY", D1, 12345)
         assert sig1 == sig2
 
     def test_signature_differs_with_different_inputs(self, connected_adapter):
         """Test that different inputs produce different signatures."""
-        sig1 = connected_adapter._create_order_signature(
-            "ETH-PERP", "BUY", Decimal("1.0"), 12345
-        )
-        sig2 = connected_adapter._create_order_signature(
-            "ETH-PERP", "SELL", Decimal("1.0"), 12345
-        )
+        sig1 = connected_adapter._create_order_signature("ETH-PERP", "BUY", D1, 12345)
+        sig2 = connected_adapter._create_order_signature("ETH-PERP", "SELL", D1, 12345)
         assert sig1 != sig2
 
 
-# =============================================================================
-# Story 2.7 Tests: Retry Logic with Exponential Backoff
-# =============================================================================
+class TestDecimalParsing:
+    """Tests for wire amount conversion helper."""
 
+    @pytest.mark.parametrize("text", ["0", "0.0", "0.00"])
+    def test_zero_amounts_reuse_shared_instance(self, text):
+        """Zero strings map to shared Decimals with the same exponent."""
+        value = _to_decimal(text)
+        assert value is _to_decimal(text)
+        assert str(value) == text
 
-class TestRetryOnTimeout:
-    """Tests for AC #1: Timeout retry with exponential backoff."""
+    def test_non_zero_amount_parsed(self):
+        """Other amounts are parsed as regular Decimals."""
+        assert _to_decimal("2500.50") == Decimal("2500.50")
 
-    @pytest.mark.asyncio
-    async def test_execute_order_retries_on_timeout(self, connected_adapter):
-        """Subtask 5.1: Verify 3 retry attempts on timeout with backoff."""
-        connected_adapter.execute_order.retry.wait = wait_none()
 
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=httpx.TimeoutException("timeout")
-        )
-
-        with pytest.raises(DEXTimeoutError):
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("1.0")
-            )
-
-        # 1 initial + 3 retries = 4 total calls
-        assert connected_adapter._http_client.post.call_count == 4
-
-
-class TestRetryOnServerError:
-    """Tests for AC #2: Server error (5xx) retry with logging."""
-
-    @pytest.mark.asyncio
-    async def test_execute_order_retries_on_5xx(self, connected_adapter):
-        """Subtask 5.2: Verify retries on HTTP 5xx (DEXConnectionError)."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        # 5xx triggers raise_for_status -> HTTPStatusError -> DEXConnectionError
-        mock_response = MagicMock()
-        mock_response.status_code = 503
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Service Unavailable",
-            request=httpx.Request("POST", "http://test/user/order"),
-            response=mock_response,
-        )
-        connected_adapter._http_client.post = AsyncMock(
-            return_value=mock_response
-        )
-
-        with pytest.raises(DEXConnectionError):
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("1.0")
-            )
+# =============================================================================
+# Story 2.7 Tests: Retry Logic with Exponential Backoff
+# =============================================================================
 
-        # Should have retried (4 total calls)
-        assert connected_adapter._http_client.post.call_count == 4
 
-    @pytest.mark.asyncio
-    async def test_execute_order_retries_on_connection_error(
-        self, connected_adapter
+class TestRetryOnTransientErrors:
+    """Tests for AC #1, #2: Timeouts and server/network errors are retried."""
+
+    @pytest.mark.parametrize(
+        "outcome,expected_exc",
+        [
+            # Subtask 5.1: timeout
+            (httpx.TimeoutException("timeout"), DEXTimeoutError),
+            # Subtask 5.2: 5xx -> raise_for_status -> DEXConnectionError
+            (make_response(503), DEXConnectionError),
+            # Subtask 5.9: network error
+            (httpx.ConnectError("Connection refused"), DEXConnectionError),
+        ],
+        ids=["timeout", "5xx", "connection-error"],
+    )
+    async def test_execute_order_retries_transient_error(
+        self, connected_adapter, outcome, expected_exc
     ):
-        """Subtask 5.9: Verify retries on DEXConnectionError (network errors)."""
-        connected_adapter.execute_order.retry.wait = wait_none()
+        """Transient failures are retried: 1 initial + 3 retries = 4 calls."""
+        connected_adapter._http_client.post, calls = counting_post(outcome)
 
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=httpx.ConnectError("Connection refused")
-        )
+        with pytest.raises(expected_exc):
+            await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
-        with pytest.raises(DEXConnectionError):
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("1.0")
-            )
-
-        # Should have retried (4 total calls)
-        assert connected_adapter._http_client.post.call_count == 4
+        assert len(calls) == 4
 
 
 class TestClientErrorNoRetry:
     """Tests for AC #3: Client errors (4xx) are NOT retried."""
 
-    @pytest.mark.asyncio
-    async def test_no_retry_on_rejection_error(self, connected_adapter):
-        """Subtask 5.3: Verify DEXRejectionError is NOT retried."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "error": "INVALID_SYMBOL",
-            "message": "Symbol not found",
-        }
+    @pytest.mark.parametrize(
+        "error_code,expected_exc",
+        [
+            # Subtask 5.3
+            ("INVALID_SYMBOL", DEXRejectionError),
+            # Subtask 5.4
+            ("INSUFFICIENT_MARGIN", DEXInsufficientFundsError),
+        ],
+    )
+    async def test_no_retry_on_rejection(
+        self, connected_adapter, error_code, expected_exc
+    ):
+        """Order rejections raise immediately after a single call."""
         connected_adapter._http_client.post = AsyncMock(
-            return_value=mock_response
-        )
-
-        with pytest.raises(DEXRejectionError):
-            await connected_adapter.execute_order(
-                "INVALID", "buy", Decimal("1.0")
+            return_value=make_response(
+                400, {"error": error_code, "message": "Order rejected"}
             )
-
-        # Should have been called only once (no retry)
-        assert connected_adapter._http_client.post.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_no_retry_on_insufficient_funds(self, connected_adapter):
-        """Subtask 5.4: Verify DEXInsufficientFundsError is NOT retried."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "error": "INSUFFICIENT_MARGIN",
-            "message": "Not enough margin",
-        }
-        connected_adapter._http_client.post = AsyncMock(
-            return_value=mock_response
         )
 
-        with pytest.raises(DEXInsufficientFundsError):
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("100.0")
-            )
+        with pytest.raises(expected_exc):
+            await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
-        # Should have been called only once (no retry)
         assert connected_adapter._http_client.post.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_no_retry_on_not_connected_error(self, extended_adapter):
         """Verify disconnected adapter raises DEXError without retry."""
         # Adapter not connected - no HTTP client
@@ -1031,23 +1123,17 @@ class TestClientErrorNoRetry:
 
         # Should raise DEXError immediately without retry attempts
         with pytest.raises(DEXError, match="Not connected"):
-            await extended_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("1.0")
-            )
+            await extended_adapter.execute_order("ETH-PERP", "buy", D1)
 
 
 class TestOrderSizeValidation:
     """Tests for order size validation before submission."""
 
-    @pytest.mark.asyncio
     async def test_reject_zero_size_order(self, connected_adapter):
         """Verify orders with size=0 are rejected immediately."""
         with pytest.raises(ValueError, match="must be positive"):
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("0")
-            )
+            await connected_adapter.execute_order("ETH-PERP", "buy", D0)
 
-    @pytest.mark.asyncio
     async def test_reject_negative_size_order(self, connected_adapter):
         """Verify orders with negative size are rejected immediately."""
         with pytest.raises(ValueError, match="must be positive"):
@@ -1055,109 +1141,96 @@ class TestOrderSizeValidation:
                 "ETH-PERP", "buy", Decimal("-1.5")
             )
 
+    async def test_invalid_size_skips_retry_loop(
+        self, connected_adapter, monkeypatch
+    ):
+        """Invalid sizes are rejected before the retried submission runs."""
+        submit = AsyncMock()
+        monkeypatch.setattr(connected_adapter, "_submit_order", submit)
+
+        with pytest.raises(ValueError, match="must be positive"):
+            await connected_adapter.execute_order("ETH-PERP", "buy", D0)
+
+        submit.assert_not_called()
+
 
 class TestRetriesExhausted:
     """Tests for AC #4: Final error returned when all retries fail."""
 
-    @pytest.mark.asyncio
     async def test_all_retries_exhausted_returns_final_error(
         self, connected_adapter
     ):
         """Subtask 5.5: Verify final error is returned after all retries."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=httpx.TimeoutException("persistent timeout")
+        connected_adapter._http_client.post, calls = counting_post(
+            httpx.TimeoutException("persistent timeout")
         )
 
         with pytest.raises(DEXTimeoutError) as exc_info:
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("1.0")
-            )
+            await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
         assert "timed out" in str(exc_info.value).lower()
         # All 4 attempts exhausted
-        assert connected_adapter._http_client.post.call_count == 4
+        assert len(calls) == 4
 
 
 class TestTenacityImplementation:
     """Tests for AC #5: Tenacity library usage with jitter."""
 
-    def test_execute_order_has_retry_decorator(self):
-        """Verify execute_order uses tenacity @retry decorator."""
-        from kitkat.adapters.extended import ExtendedAdapter
+    def test_retry_decorator_configured(self):
+        """Verify order submission uses tenacity @retry with stop and jitter wait.
 
+        Subtask 5.7: stop_after_attempt(4) (1 initial + 3 retries) and an
+        exponential jitter wait are configured on the decorator. The retry
+        sits on _submit_order, behind execute_order's size validation.
+        """
         # Tenacity-decorated methods have a .retry attribute
-        assert hasattr(ExtendedAdapter.execute_order, "retry")
-
-    def test_retry_configured_with_correct_stop(self, connected_adapter):
-        """Verify retry stops after 4 attempts (1 initial + 3 retries)."""
-        retry_state = connected_adapter.execute_order.retry
-        # Check stop config - stop_after_attempt(4)
-        assert retry_state.stop is not None
-
-    def test_retry_configured_with_jitter(self, connected_adapter):
-        """Subtask 5.7: Verify jitter is applied (delays are not exact)."""
-        retry_state = connected_adapter.execute_order.retry
-        # Check wait config exists (exponential jitter)
+        assert not hasattr(ExtendedAdapter.execute_order, "retry")
+        retry_state = ExtendedAdapter._submit_order.retry
+        assert retry_state.stop.max_attempt_number == 4
         assert retry_state.wait is not None
 
-    @pytest.mark.asyncio
-    async def test_retry_logging_on_each_attempt(
-        self, connected_adapter, caplog
-    ):
+    async def test_retry_logging_on_each_attempt(self, connected_adapter):
         """Subtask 5.6: Verify attempt number is logged on each retry."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=httpx.TimeoutException("timeout")
+        connected_adapter._http_client.post, _ = counting_post(
+            httpx.TimeoutException("timeout")
         )
 
-        with caplog.at_level(
-            logging.WARNING, logger="kitkat.adapters.extended.retry"
-        ):
+        # A bare list handler skips pytest's capture and formatting machinery
+        retry_logs = []
+        handler = logging.Handler()
+        handler.emit = retry_logs.append
+        retry_logger = logging.getLogger("kitkat.adapters.extended.retry")
+        previous_level = retry_logger.level
+        retry_logger.addHandler(handler)
+        retry_logger.setLevel(logging.WARNING)
+        try:
             with pytest.raises(DEXTimeoutError):
-                await connected_adapter.execute_order(
-                    "ETH-PERP", "buy", Decimal("1.0")
-                )
+                await connected_adapter.execute_order("ETH-PERP", "buy", D1)
+        finally:
+            retry_logger.removeHandler(handler)
+            retry_logger.setLevel(previous_level)
 
         # before_sleep_log logs a WARNING before each retry sleep
         # 3 retries = 3 log messages
-        retry_logs = [
-            r
-            for r in caplog.records
-            if r.name == "kitkat.adapters.extended.retry"
-        ]
         assert len(retry_logs) == 3
 
 
 class TestNonceRegenerationOnRetry:
     """Tests for nonce regeneration during retry attempts."""
 
-    @pytest.mark.asyncio
     async def test_nonce_regenerated_on_each_retry(self, connected_adapter):
         """Subtask 5.8: Verify each retry attempt uses a different nonce."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
         captured_nonces = []
 
-        original_post = AsyncMock(
-            side_effect=httpx.TimeoutException("timeout")
-        )
-
         async def capture_nonce_post(url, **kwargs):
             payload = kwargs.get("json", {})
             captured_nonces.append(payload.get("nonce"))
-            return await original_post(url, **kwargs)
+            raise httpx.TimeoutException("timeout")
 
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=capture_nonce_post
-        )
+        connected_adapter._http_client.post = capture_nonce_post
 
         with pytest.raises(DEXTimeoutError):
-            await connected_adapter.execute_order(
-                "ETH-PERP", "buy", Decimal("1.0")
-            )
+            await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
         # Should have 4 nonces (1 initial + 3 retries), all unique
         assert len(captured_nonces) == 4
@@ -1169,60 +1242,34 @@ class TestNonceRegenerationOnRetry:
 class TestSuccessfulRecoveryOnRetry:
     """Tests for successful recovery after transient failure."""
 
-    @pytest.mark.asyncio
-    async def test_succeeds_on_second_attempt(self, connected_adapter):
-        """Subtask 5.10: Verify successful recovery after one failure."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        success_response = MagicMock()
-        success_response.status_code = 200
-        success_response.json.return_value = {
-            "order_id": "ord_retry_ok",
-            "status": "PENDING",
-            "created_at": "2026-01-27T10:00:00Z",
-        }
-
+    @pytest.mark.parametrize(
+        "failures",
+        [
+            # Subtask 5.10: one timeout, then success
+            [httpx.TimeoutException("timeout")],
+            # Network error, then timeout, then success
+            [httpx.ConnectError("refused"), httpx.TimeoutException("timeout")],
+        ],
+        ids=["second-attempt", "third-attempt"],
+    )
+    async def test_succeeds_after_transient_failures(
+        self, connected_adapter, failures
+    ):
+        """execute_order recovers once a retry attempt succeeds."""
+        success_response = make_response(
+            200,
+            {
+                "order_id": "ord_retry_ok",
+                "status": "PENDING",
+                "created_at": "2026-01-27T10:00:00Z",
+            },
+        )
         connected_adapter._http_client.post = AsyncMock(
-            side_effect=[
-                httpx.TimeoutException("timeout"),  # First call fails
-                success_response,  # Second call succeeds
-            ]
+            side_effect=[*failures, success_response]
         )
 
-        result = await connected_adapter.execute_order(
-            "ETH-PERP", "buy", Decimal("1.0")
-        )
+        result = await connected_adapter.execute_order("ETH-PERP", "buy", D1)
 
         assert result.order_id == "ord_retry_ok"
         assert result.status == "submitted"
-        assert connected_adapter._http_client.post.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_succeeds_on_third_attempt_after_connection_errors(
-        self, connected_adapter
-    ):
-        """Verify recovery after two connection errors."""
-        connected_adapter.execute_order.retry.wait = wait_none()
-
-        success_response = MagicMock()
-        success_response.status_code = 200
-        success_response.json.return_value = {
-            "order_id": "ord_recover",
-            "status": "PENDING",
-            "created_at": "2026-01-27T10:00:00Z",
-        }
-
-        connected_adapter._http_client.post = AsyncMock(
-            side_effect=[
-                httpx.ConnectError("refused"),  # First: network error
-                httpx.TimeoutException("timeout"),  # Second: timeout
-                success_response,  # Third: success
-            ]
-        )
-
-        result = await connected_adapter.execute_order(
-            "ETH-PERP", "buy", Decimal("1.0")
-        )
-
-        assert result.order_id == "ord_recover"
-        assert connected_adapter._http_client.post.call_count == 3
+        assert connected_adapter._http_client.post.call_count == len(failures) + 1
@@ -1,8 +1,11 @@
 """Tests for configuration API endpoints (Story 5.6, 5.7, 5.8)."""
 
+import json
+
 import pytest
 from httpx import AsyncClient
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 
 # ============================================================================
@@ -11,11 +14,14 @@ from unittest.mock import AsyncMock, patch
 
 
 @pytest.mark.asyncio
-async def test_webhook_config_returns_all_fields(
+async def test_webhook_config_response(
     async_client: AsyncClient,
     authenticated_user,
 ):
-    """Test AC#1: GET /api/config/webhook returns complete structure."""
+    """Test AC#1-#5: one GET /api/config/webhook, every slice of the body checked.
+
+    Each section below was a separate test making the same request.
+    """
     response = await async_client.get(
         "/api/config/webhook",
         headers={"Authorization": f"Bearer {authenticated_user['token']}"},
@@ -23,13 +29,13 @@ async def test_webhook_config_returns_all_fields(
     assert response.status_code == 200
     data = response.json()
 
-    # Verify all required fields
+    # AC#1: all required fields
     assert "webhook_url" in data
     assert "payload_format" in data
     assert "tradingview_setup" in data
     assert "token_display" in data  # AC#5
 
-    # Verify payload_format structure (AC#3)
+    # AC#3: payload_format structure
     pf = data["payload_format"]
     assert "required_fields" in pf
     assert "optional_fields" in pf
@@ -37,31 +43,19 @@ async def test_webhook_config_returns_all_fields(
     assert pf["required_fields"] == ["symbol", "side", "size"]
     assert pf["optional_fields"] == ["price", "order_type"]
 
-    # Verify tradingview_setup structure (AC#4)
+    # AC#4: tradingview_setup structure
     ts = data["tradingview_setup"]
     assert "alert_name" in ts
     assert "webhook_url" in ts
     assert "message_template" in ts
 
+    # AC#2: webhook_url includes user's unique token
+    assert "?token=" in data["webhook_url"]
+    assert authenticated_user["webhook_token"] in data["webhook_url"]
 
-@pytest.mark.asyncio
-async def test_webhook_config_token_display_abbreviated(
-    async_client: AsyncClient,
-    authenticated_user,
-):
-    """Test AC#5: token_display shows first 8 chars + '...' for tokens longer than 8 chars."""
-    response = await async_client.get(
-        "/api/config/webhook",
-        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-    )
-    assert response.status_code == 200
-    data = response.json()
-
-    # Extract full token from webhook_url
+    # AC#5: token_display shows first 8 chars + '...' for tokens over 8 chars
     full_token = data["webhook_url"].split("token=")[1]
     token_display = data["token_display"]
-
-    # For tokens > 8 chars: should be abbreviated with "..."
     if len(full_token) > 8:
         assert token_display.endswith("...")
         assert len(token_display) == 11  # 8 chars + "..."
@@ -70,6 +64,15 @@ async def test_webhook_config_token_display_abbreviated(
         # For short tokens (≤8 chars): full token returned without "..."
         assert token_display == full_token
 
+    # AC#4: ready-to-paste message template with TradingView placeholders
+    template = json.loads(ts["message_template"])
+    assert "symbol" in template
+    assert "side" in template
+    assert "size" in template
+    assert template["symbol"] == "{{ticker}}"
+    assert template["side"] == "{{strategy.order.action}}"
+    assert template["size"] == "{{strategy.position_size}}"
+
 
 @pytest.mark.asyncio
 async def test_webhook_config_requires_authentication(
@@ -120,53 +123,6 @@ async def test_webhook_config_500_when_token_not_configured(
         app.dependency_overrides.pop(get_current_user, None)
 
 
-@pytest.mark.asyncio
-async def test_webhook_config_tradingview_message_template(
-    async_client: AsyncClient,
-    authenticated_user,
-):
-    """Test AC#4: TradingView setup contains ready-to-paste message with correct placeholders."""
-    response = await async_client.get(
-        "/api/config/webhook",
-        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-    )
-    assert response.status_code == 200
-    data = response.json()
-
-    ts = data["tradingview_setup"]
-
-    # Message template should be valid JSON
-    import json
-    template = json.loads(ts["message_template"])
-    assert "symbol" in template
-    assert "side" in template
-    assert "size" in template
-
-    # Verify TradingView placeholder syntax (M2 fix: verify actual values)
-    assert template["symbol"] == "{{ticker}}"
-    assert template["side"] == "{{strategy.order.action}}"
-    assert template["size"] == "{{strategy.position_size}}"
-
-
-@pytest.mark.asyncio
-async def test_webhook_config_url_contains_token(
-    async_client: AsyncClient,
-    authenticated_user,
-):
-    """Test AC#2: webhook_url includes user's unique token."""
-    response = await async_client.get(
-        "/api/config/webhook",
-        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-    )
-    assert response.status_code == 200
-    data = response.json()
-
-    # URL should contain token query param
-    assert "?token=" in data["webhook_url"]
-    # URL should contain user's webhook token
-    assert authenticated_user["webhook_token"] in data["webhook_url"]
-
-
 # ============================================================================
 # Position Size Config Tests (Story 5.6)
 # ============================================================================
@@ -516,88 +472,94 @@ async def test_get_telegram_config_configured(
 async def test_put_telegram_config_success(
     async_client: AsyncClient,
     authenticated_user,
+    monkeypatch,
 ):
     """Test AC#2, #3: PUT /api/config/telegram saves chat_id when test succeeds."""
-    with patch("kitkat.api.config.TelegramAlertService") as mock_alert_class, \
-         patch("kitkat.api.config.get_settings") as mock_get_settings:
-        # Mock settings to have bot token
-        mock_settings = mock_get_settings.return_value
-        mock_settings.telegram_bot_token = "test-bot-token"
-
-        # Mock the service to return success
-        mock_instance = AsyncMock()
-        mock_instance.send_test_message = AsyncMock(return_value=True)
-        mock_alert_class.return_value = mock_instance
-
-        response = await async_client.put(
-            "/api/config/telegram",
-            headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-            json={"chat_id": "987654321"},
-        )
-        assert response.status_code == 200
-        data = response.json()
+    # Mock settings to have bot token
+    settings = SimpleNamespace(telegram_bot_token="test-bot-token")
+    monkeypatch.setattr("kitkat.api.config.get_settings", lambda: settings)
+
+    # Mock the service to return success
+    mock_instance = AsyncMock()
+    mock_instance.send_test_message = AsyncMock(return_value=True)
+    monkeypatch.setattr(
+        "kitkat.api.config.TelegramAlertService",
+        MagicMock(return_value=mock_instance),
+    )
 
-        assert data["configured"] is True
-        assert data["chat_id"] == "987654321"
-        assert data["bot_status"] == "connected"
+    response = await async_client.put(
+        "/api/config/telegram",
+        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
+        json={"chat_id": "987654321"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["configured"] is True
+    assert data["chat_id"] == "987654321"
+    assert data["bot_status"] == "connected"
 
-        # Verify test message was called
-        mock_instance.send_test_message.assert_called_once()
+    # Verify test message was called
+    mock_instance.send_test_message.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_put_telegram_config_test_fails(
     async_client: AsyncClient,
     authenticated_user,
+    monkeypatch,
 ):
     """Test AC#4: PUT /api/config/telegram returns 400 when test fails."""
-    with patch("kitkat.api.config.TelegramAlertService") as mock_alert_class, \
-         patch("kitkat.api.config.get_settings") as mock_get_settings:
-        # Mock settings to have bot token
-        mock_settings = mock_get_settings.return_value
-        mock_settings.telegram_bot_token = "test-bot-token"
-
-        # Mock the service to return failure
-        mock_instance = AsyncMock()
-        mock_instance.send_test_message = AsyncMock(return_value=False)
-        mock_alert_class.return_value = mock_instance
-
-        response = await async_client.put(
-            "/api/config/telegram",
-            headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-            json={"chat_id": "invalid_chat_id"},
-        )
-        assert response.status_code == 400
-        data = response.json()
+    # Mock settings to have bot token
+    settings = SimpleNamespace(telegram_bot_token="test-bot-token")
+    monkeypatch.setattr("kitkat.api.config.get_settings", lambda: settings)
+
+    # Mock the service to return failure
+    mock_instance = AsyncMock()
+    mock_instance.send_test_message = AsyncMock(return_value=False)
+    monkeypatch.setattr(
+        "kitkat.api.config.TelegramAlertService",
+        MagicMock(return_value=mock_instance),
+    )
 
-        assert "Failed to send test message" in data["detail"]
+    response = await async_client.put(
+        "/api/config/telegram",
+        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
+        json={"chat_id": "invalid_chat_id"},
+    )
+    assert response.status_code == 400
+    data = response.json()
+
+    assert "Failed to send test message" in data["detail"]
 
 
 @pytest.mark.asyncio
 async def test_put_telegram_config_not_saved_on_failure(
     async_client: AsyncClient,
     authenticated_user,
+    monkeypatch,
 ):
     """Test AC#4: Config is NOT saved when test message fails."""
-    with patch("kitkat.api.config.TelegramAlertService") as mock_alert_class, \
-         patch("kitkat.api.config.get_settings") as mock_get_settings:
-        # Mock settings to have bot token
-        mock_settings = mock_get_settings.return_value
-        mock_settings.telegram_bot_token = "test-bot-token"
-
-        # Mock the service to return failure
-        mock_instance = AsyncMock()
-        mock_instance.send_test_message = AsyncMock(return_value=False)
-        mock_alert_class.return_value = mock_instance
-
-        # Attempt configuration with failing test
-        await async_client.put(
-            "/api/config/telegram",
-            headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-            json={"chat_id": "invalid_chat_id"},
-        )
+    # Mock settings to have bot token
+    settings = SimpleNamespace(telegram_bot_token="test-bot-token")
+    monkeypatch.setattr("kitkat.api.config.get_settings", lambda: settings)
+
+    # Mock the service to return failure
+    mock_instance = AsyncMock()
+    mock_instance.send_test_message = AsyncMock(return_value=False)
+    monkeypatch.setattr(
+        "kitkat.api.config.TelegramAlertService",
+        MagicMock(return_value=mock_instance),
+    )
+
+    # Attempt configuration with failing test
+    await async_client.put(
+        "/api/config/telegram",
+        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
+        json={"chat_id": "invalid_chat_id"},
+    )
 
-    # Verify config was NOT saved (outside the mock context)
+    # Verify config was NOT saved
     response = await async_client.get(
         "/api/config/telegram",
         headers={"Authorization": f"Bearer {authenticated_user['token']}"},
@@ -646,17 +608,18 @@ async def test_put_telegram_config_empty_chat_id_rejected(
 async def test_put_telegram_config_bot_not_configured(
     async_client: AsyncClient,
     authenticated_user,
+    monkeypatch,
 ):
     """Test AC#6: PUT fails gracefully when bot token not configured on server."""
     # Patch settings to have no bot token
-    with patch("kitkat.api.config.get_settings") as mock_settings:
-        mock_settings.return_value.telegram_bot_token = ""
+    settings = SimpleNamespace(telegram_bot_token="")
+    monkeypatch.setattr("kitkat.api.config.get_settings", lambda: settings)
 
-        response = await async_client.put(
-            "/api/config/telegram",
-            headers={"Authorization": f"Bearer {authenticated_user['token']}"},
-            json={"chat_id": "123456789"},
-        )
-        assert response.status_code == 503
-        data = response.json()
-        assert "not configured" in data["detail"].lower()
+    response = await async_client.put(
+        "/api/config/telegram",
+        headers={"Authorization": f"Bearer {authenticated_user['token']}"},
+        json={"chat_id": "123456789"},
+    )
+    assert response.status_code == 503
+    data = response.json()
+    assert "not configured" in data["detail"].lower()
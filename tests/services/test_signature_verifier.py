@@ -106,6 +106,21 @@ class TestChallengeStore:
         result = challenge_store.consume_challenge(nonce)
 
         assert result is None
+        assert nonce not in challenge_store._challenges
+
+    def test_create_challenge_sweeps_expired_after_interval(self, challenge_store):
+        """Expired challenges are swept once the cleanup interval has elapsed."""
+        wallet = "0x1234567890123456789012345678901234567890"
+        past = datetime.now(timezone.utc) - timedelta(minutes=10)
+        challenge_store._challenges["stale-nonce"] = (wallet.lower(), past, "msg")
+
+        # Within the interval the stale entry is left for lazy expiry
+        challenge_store.create_challenge(wallet)
+        assert "stale-nonce" in challenge_store._challenges
+
+        challenge_store._last_cleanup -= 3600
+        challenge_store.create_challenge(wallet)
+        assert "stale-nonce" not in challenge_store._challenges
 
 
 class TestSignatureVerifier:
@@ -13,7 +13,8 @@ Story 5.1: Stats Service & Volume Tracking
 """
 
 import json
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -204,60 +205,84 @@ class TestPeriodBoundsCalculation:
         assert start.day == 1
         assert start.tzinfo is not None
 
+    def test_bounds_use_given_reference_time(self):
+        """Test bounds are derived from the supplied reference time."""
+        from kitkat.services.stats import StatsService
+
+        service = StatsService(session_factory=MagicMock())
+        # Wednesday afternoon
+        now = datetime(2026, 1, 14, 15, 30, tzinfo=timezone.utc)
+
+        start, end = service._calculate_period_bounds("this_week", now)
+
+        assert start == datetime(2026, 1, 12, tzinfo=timezone.utc)
+        assert end == now
+
+
+@pytest.fixture
+def add_executions():
+    """Insert executions into the test database.
+
+    result_data given as a str is stored verbatim, so malformed JSON can be
+    inserted.
+    """
+    from kitkat.database import ExecutionModel, get_async_session_factory
+
+    factory = get_async_session_factory()
+
+    async def _add(*rows):
+        async with factory() as session:
+            for i, (dex_id, status, result_data) in enumerate(rows):
+                session.add(
+                    ExecutionModel(
+                        signal_id=f"sig-{i}",
+                        dex_id=dex_id,
+                        status=status,
+                        result_data=(
+                            result_data
+                            if isinstance(result_data, str)
+                            else json.dumps(result_data)
+                        ),
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+            await session.commit()
+
+    return _add
+
+
+@pytest.fixture
+def stats_service():
+    """StatsService bound to the test database."""
+    from kitkat.database import get_async_session_factory
+    from kitkat.services.stats import StatsService
+
+    return StatsService(session_factory=get_async_session_factory())
+
 
 class TestVolumeCalculation:
-    """Test volume calculation logic (AC#2, AC#4, Task 3)."""
+    """Test volume calculation logic (AC#2, AC#4, Task 3).
 
-    @pytest.fixture
-    def mock_session_factory(self):
-        """Create a mock session factory for testing."""
-        mock_factory = MagicMock()
-        return mock_factory
+    Fill values are read by SQL and summed as Decimal in Python, so these tests
+    run against the test database.
+    """
 
     @pytest.mark.asyncio
-    async def test_volume_calculation_with_filled_executions(self):
+    async def test_volume_calculation_with_filled_executions(
+        self, stats_service, add_executions
+    ):
         """Test volume sums filled_size * fill_price (AC#4)."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
-        # Create mock executions
-        mock_execution1 = MagicMock(spec=ExecutionModel)
-        mock_execution1.id = 1
-        mock_execution1.dex_id = "extended"
-        mock_execution1.status = "filled"
-        mock_execution1.result_data = json.dumps({
-            "filled_size": "0.5",
-            "fill_price": "2000.00",
-            "is_test_mode": False
-        })
-        mock_execution1.created_at = datetime.now(timezone.utc)
-
-        mock_execution2 = MagicMock(spec=ExecutionModel)
-        mock_execution2.id = 2
-        mock_execution2.dex_id = "extended"
-        mock_execution2.status = "filled"
-        mock_execution2.result_data = json.dumps({
-            "filled_size": "1.0",
-            "fill_price": "2100.00",
-            "is_test_mode": False
-        })
-        mock_execution2.created_at = datetime.now(timezone.utc)
-
-        # Mock session
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_execution1, mock_execution2]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        # Mock factory context manager
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            ("extended", "filled", {
+                "filled_size": "0.5", "fill_price": "2000.00", "is_test_mode": False
+            }),
+            ("extended", "partial", {
+                "filled_size": "1.0", "fill_price": "2100.00", "is_test_mode": False
+            }),
+            ("extended", "failed", {"filled_size": "9.0", "fill_price": "2100.00"}),
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_volume_stats(dex_id="extended", period="today")
+        stats = await stats_service.get_volume_stats(dex_id="extended", period="today")
 
         # 0.5 * 2000 + 1.0 * 2100 = 1000 + 2100 = 3100
         assert stats.volume_usd == Decimal("3100.00")
@@ -265,124 +290,107 @@ class TestVolumeCalculation:
         assert stats.dex_id == "extended"
 
     @pytest.mark.asyncio
-    async def test_test_mode_executions_excluded(self):
+    async def test_test_mode_executions_excluded(self, stats_service, add_executions):
         """Test that test mode executions are excluded from volume (AC#4)."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
-        # One regular execution, one test mode
-        mock_execution1 = MagicMock(spec=ExecutionModel)
-        mock_execution1.id = 1
-        mock_execution1.dex_id = "extended"
-        mock_execution1.status = "filled"
-        mock_execution1.result_data = json.dumps({
-            "filled_size": "1.0",
-            "fill_price": "2000.00",
-            "is_test_mode": False
-        })
-        mock_execution1.created_at = datetime.now(timezone.utc)
-
-        mock_execution2 = MagicMock(spec=ExecutionModel)
-        mock_execution2.id = 2
-        mock_execution2.dex_id = "mock"
-        mock_execution2.status = "filled"
-        mock_execution2.result_data = json.dumps({
-            "filled_size": "5.0",
-            "fill_price": "2000.00",
-            "is_test_mode": True  # Test mode - should be excluded
-        })
-        mock_execution2.created_at = datetime.now(timezone.utc)
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_execution1, mock_execution2]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            ("extended", "filled", {
+                "filled_size": "1.0", "fill_price": "2000.00", "is_test_mode": False
+            }),
+            ("mock", "filled", {
+                "filled_size": "5.0", "fill_price": "2000.00", "is_test_mode": True
+            }),
+            ("mock", "filled", {
+                "filled_size": "3.0", "fill_price": "2000.00", "is_test_mode": "true"
+            }),
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_volume_stats(period="today")
+        stats = await stats_service.get_volume_stats(period="today")
 
         # Only first execution counted: 1.0 * 2000 = 2000
         assert stats.volume_usd == Decimal("2000.00")
         assert stats.execution_count == 1
 
     @pytest.mark.asyncio
-    async def test_empty_results_return_zero(self):
+    async def test_empty_results_return_zero(self, stats_service):
         """Test empty results return zero values (Task 6.6)."""
-        from kitkat.services.stats import StatsService
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []  # No executions
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_volume_stats(dex_id="extended", period="today")
+        stats = await stats_service.get_volume_stats(dex_id="extended", period="today")
 
         assert stats.volume_usd == Decimal("0")
         assert stats.execution_count == 0
 
     @pytest.mark.asyncio
-    async def test_per_dex_filtering(self):
+    async def test_per_dex_filtering(self, stats_service, add_executions):
         """Test volume is filtered by DEX ID (Task 6.4)."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
-        # Execution for 'extended' DEX
-        mock_execution1 = MagicMock(spec=ExecutionModel)
-        mock_execution1.id = 1
-        mock_execution1.dex_id = "extended"
-        mock_execution1.status = "filled"
-        mock_execution1.result_data = json.dumps({
-            "filled_size": "1.0",
-            "fill_price": "2000.00",
-            "is_test_mode": False
-        })
-        mock_execution1.created_at = datetime.now(timezone.utc)
-
-        # Execution for 'mock' DEX
-        mock_execution2 = MagicMock(spec=ExecutionModel)
-        mock_execution2.id = 2
-        mock_execution2.dex_id = "mock"
-        mock_execution2.status = "filled"
-        mock_execution2.result_data = json.dumps({
-            "filled_size": "5.0",
-            "fill_price": "1000.00",
-            "is_test_mode": False
-        })
-        mock_execution2.created_at = datetime.now(timezone.utc)
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        # Return only extended execution when filtering by dex_id="extended"
-        mock_scalars.all.return_value = [mock_execution1]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            ("extended", "filled", {
+                "filled_size": "1.0", "fill_price": "2000.00", "is_test_mode": False
+            }),
+            ("mock", "filled", {
+                "filled_size": "5.0", "fill_price": "1000.00", "is_test_mode": False
+            }),
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_volume_stats(dex_id="extended", period="today")
+        stats = await stats_service.get_volume_stats(dex_id="extended", period="today")
 
         # Only 'extended' DEX volume: 1.0 * 2000 = 2000
         assert stats.volume_usd == Decimal("2000.00")
         assert stats.execution_count == 1
         assert stats.dex_id == "extended"
 
+    @pytest.mark.asyncio
+    async def test_volume_is_exact_decimal(self, stats_service, add_executions):
+        """Test volume is summed exactly, not in float64 (AC#4)."""
+        await add_executions(
+            ("extended", "filled", {"filled_size": "0.00000001", "fill_price": "0.5"}),
+            ("extended", "filled", '{"filled_size": 0.1, "fill_price": 3}'),
+            ("extended", "filled", {
+                "filled_size": "123456789.123456789", "fill_price": "1.000000001"
+            }),
+        )
+
+        stats = await stats_service.get_volume_stats(dex_id="extended", period="today")
+
+        assert stats.volume_usd == (
+            Decimal("0.000000005")
+            + Decimal("0.3")
+            + Decimal("123456789.123456789") * Decimal("1.000000001")
+        )
+        assert stats.execution_count == 3
+
+    @pytest.mark.asyncio
+    async def test_malformed_json_counts_as_zero_volume(
+        self, stats_service, add_executions
+    ):
+        """Test malformed result_data does not fail the volume query."""
+        await add_executions(
+            ("extended", "filled", {"filled_size": "1.0", "fill_price": "2000"}),
+            ("extended", "filled", "{not valid json"),
+        )
+
+        stats = await stats_service.get_volume_stats(dex_id="extended", period="today")
+
+        assert stats.volume_usd == Decimal("2000")
+        assert stats.execution_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_numeric_fill_values_are_not_counted(
+        self, stats_service, add_executions
+    ):
+        """Test executions with non-numeric size or price are skipped."""
+        await add_executions(
+            ("extended", "filled", {"filled_size": "1.0", "fill_price": "2000"}),
+            ("extended", "filled", {"filled_size": "abc", "fill_price": "2000"}),
+            ("extended", "filled", {"filled_size": "1.0", "fill_price": "NaN"}),
+            ("extended", "filled", {"filled_size": True, "fill_price": "2000"}),
+            ("extended", "filled", {"filled_size": ["1"], "fill_price": "2000"}),
+            ("extended", "filled", {"filled_size": None, "fill_price": "2000"}),
+        )
+
+        stats = await stats_service.get_volume_stats(dex_id="extended", period="today")
+
+        assert stats.volume_usd == Decimal("2000")
+        assert stats.execution_count == 1
+
 
 class TestCaching:
     """Test caching behavior (AC#5, Task 4)."""
@@ -395,13 +403,13 @@ class TestCaching:
         service = StatsService(session_factory=MagicMock())
 
         key1 = service._get_cache_key(user_id=123, dex_id="extended", period="today")
-        assert key1 == "123:extended:today"
+        assert key1 == (123, "extended", "today")
 
         key2 = service._get_cache_key(user_id=None, dex_id=None, period="this_week")
-        assert key2 == "all:all:this_week"
+        assert key2 == (None, None, "this_week")
 
         key3 = service._get_cache_key(user_id=456, dex_id=None, period="all_time")
-        assert key3 == "456:all:all_time"
+        assert key3 == (456, None, "all_time")
 
     def test_cache_validity_check(self):
         """Test cache TTL validation (Task 4.3)."""
@@ -410,26 +418,25 @@ class TestCaching:
         service = StatsService(session_factory=MagicMock(), cache_ttl=60)
 
         # Not in cache
-        assert not service._is_cache_valid("nonexistent:key:today")
+        assert not service._is_cache_valid((None, "nonexistent", "today"))
 
         # Add to cache
-        now = datetime.now(timezone.utc)
         stats = VolumeStats(
             dex_id="extended",
             period="today",
             volume_usd=Decimal("1000"),
             execution_count=5,
-            last_updated=now,
+            last_updated=datetime.now(timezone.utc),
         )
-        service._volume_cache["test:key:today"] = (stats, now)
+        now = time.monotonic()
+        service._volume_cache[(1, "extended", "today")] = (stats, now)
 
         # Should be valid immediately
-        assert service._is_cache_valid("test:key:today")
+        assert service._is_cache_valid((1, "extended", "today"))
 
         # Simulate expired cache
-        old_time = now - timedelta(seconds=120)
-        service._volume_cache["old:key:today"] = (stats, old_time)
-        assert not service._is_cache_valid("old:key:today")
+        service._volume_cache[(2, "extended", "today")] = (stats, now - 120)
+        assert not service._is_cache_valid((2, "extended", "today"))
 
     def test_cache_invalidation_all(self):
         """Test cache invalidation for all entries (Task 4.4)."""
@@ -445,8 +452,8 @@ class TestCaching:
             last_updated=now,
         )
 
-        service._volume_cache["1:extended:today"] = (stats, now)
-        service._volume_cache["2:mock:this_week"] = (stats, now)
+        service._volume_cache[(1, "extended", "today")] = (stats, time.monotonic())
+        service._volume_cache[(2, "mock", "this_week")] = (stats, time.monotonic())
         assert len(service._volume_cache) == 2
 
         service.invalidate_cache()  # Clear all
@@ -466,14 +473,138 @@ class TestCaching:
             last_updated=now,
         )
 
-        service._volume_cache["1:extended:today"] = (stats, now)
-        service._volume_cache["1:mock:this_week"] = (stats, now)
-        service._volume_cache["2:extended:today"] = (stats, now)
+        service._volume_cache[(1, "extended", "today")] = (stats, time.monotonic())
+        service._volume_cache[(1, "mock", "this_week")] = (stats, time.monotonic())
+        service._volume_cache[(2, "extended", "today")] = (stats, time.monotonic())
         assert len(service._volume_cache) == 3
 
         service.invalidate_cache(user_id=1)  # Only user 1
         assert len(service._volume_cache) == 1
-        assert "2:extended:today" in service._volume_cache
+        assert (2, "extended", "today") in service._volume_cache
+
+    def test_cache_invalidation_many_users(self):
+        """Test batch invalidation drops entries for every listed user."""
+        from kitkat.models import ExecutionPeriodStats
+        from kitkat.services.stats import StatsService
+
+        service = StatsService(session_factory=MagicMock())
+        now = time.monotonic()
+        stats = VolumeStats(
+            dex_id="extended",
+            period="today",
+            volume_usd=Decimal("1000"),
+            execution_count=5,
+            last_updated=datetime.now(timezone.utc),
+        )
+        exec_stats = ExecutionPeriodStats(
+            total=1, successful=1, failed=0, partial=0, success_rate="100.00%"
+        )
+
+        service._volume_cache[(1, "extended", "today")] = (stats, now)
+        service._volume_cache[(2, "mock", "today")] = (stats, now)
+        service._volume_cache[(3, "extended", "today")] = (stats, now)
+        service._exec_cache[(1, "today")] = (exec_stats, now)
+        service._exec_cache[(3, "today")] = (exec_stats, now)
+
+        service.invalidate_many([1, 2])
+
+        assert list(service._volume_cache) == [(3, "extended", "today")]
+        assert list(service._exec_cache) == [(3, "today")]
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test cache is bounded and evicts least recently used entries."""
+        from kitkat.database import get_async_session_factory
+        from kitkat.services.stats import StatsService
+
+        service = StatsService(
+            session_factory=get_async_session_factory(), cache_max_entries=2
+        )
+
+        await service.get_volume_stats(dex_id="extended", period="today")
+        await service.get_volume_stats(dex_id="mock", period="today")
+        # Cache hit makes "extended" most recently used
+        await service.get_volume_stats(dex_id="extended", period="today")
+        await service.get_volume_stats(dex_id="paradex", period="today")
+
+        assert list(service._volume_cache) == [
+            (None, "extended", "today"),
+            (None, "paradex", "today"),
+        ]
+
+
+class TestAggregatedVolumeCalculation:
+    """Test get_aggregated_volume_stats breakdown across DEXs."""
+
+    @pytest.mark.asyncio
+    async def test_aggregates_per_dex_stats(self, stats_service, add_executions):
+        """Test per-DEX volume is read in one query and summed into totals."""
+        await add_executions(
+            ("extended", "filled", {"filled_size": "1.0", "fill_price": "1000"}),
+            ("extended", "partial", {"filled_size": "2.0", "fill_price": "1000"}),
+            ("mock", "filled", {"filled_size": "5", "fill_price": "100"}),
+            ("mock", "filled", {
+                "filled_size": "5", "fill_price": "100", "is_test_mode": True
+            }),
+            ("paradex", "failed", {"filled_size": "1", "fill_price": "100"}),
+        )
+
+        stats = await stats_service.get_aggregated_volume_stats(period="today")
+
+        assert stats.total_volume_usd == Decimal("3500")
+        assert stats.total_execution_count == 3
+        assert list(stats.by_dex) == ["extended", "mock"]
+        assert stats.by_dex["extended"].volume_usd == Decimal("3000")
+        assert stats.by_dex["extended"].execution_count == 2
+        assert stats.by_dex["mock"].volume_usd == Decimal("500")
+        assert stats.by_dex["mock"].execution_count == 1
+
+    @pytest.mark.asyncio
+    async def test_aggregates_exact_decimal_and_skips_non_numeric(
+        self, stats_service, add_executions
+    ):
+        """Test per-DEX volume is exact and non-numeric fills are not counted."""
+        await add_executions(
+            ("extended", "filled", {"filled_size": "0.00000001", "fill_price": "0.5"}),
+            ("extended", "filled", {"filled_size": 0.1, "fill_price": 3}),
+            ("extended", "filled", {"filled_size": "abc", "fill_price": "100"}),
+            ("mock", "filled", {"filled_size": ["1"], "fill_price": "100"}),
+        )
+
+        stats = await stats_service.get_aggregated_volume_stats(period="today")
+
+        assert list(stats.by_dex) == ["extended"]
+        assert stats.by_dex["extended"].volume_usd == Decimal("0.300000005")
+        assert stats.by_dex["extended"].execution_count == 2
+        assert stats.total_volume_usd == Decimal("0.300000005")
+        assert stats.total_execution_count == 2
+
+    @pytest.mark.asyncio
+    async def test_aggregated_stats_cached(self, stats_service, add_executions):
+        """Test aggregated stats are cached per user and period (AC#5)."""
+        await add_executions(
+            ("extended", "filled", {"filled_size": "1.0", "fill_price": "1000"}),
+        )
+
+        stats1 = await stats_service.get_aggregated_volume_stats(
+            user_id=1, period="today"
+        )
+        await add_executions(
+            ("mock", "filled", {"filled_size": "5", "fill_price": "100"}),
+        )
+        stats2 = await stats_service.get_aggregated_volume_stats(
+            user_id=1, period="today"
+        )
+
+        assert stats2 is stats1
+        assert (1, "aggregated", "today") in stats_service._volume_cache
+
+        stats_service.invalidate_cache(user_id=1)
+        stats3 = await stats_service.get_aggregated_volume_stats(
+            user_id=1, period="today"
+        )
+
+        assert stats3.total_volume_usd == Decimal("1500")
 
 
 class TestStatsServiceDependency:
@@ -599,43 +730,18 @@ class TestGetExecutionStats:
     """Test StatsService.get_execution_stats method (Story 5.3: AC#1-4)."""
 
     @pytest.mark.asyncio
-    async def test_execution_stats_counts_by_status(self):
+    async def test_execution_stats_counts_by_status(
+        self, stats_service, add_executions
+    ):
         """Test execution counts correctly by filled, partial, failed status."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
-        # Create mock executions with different statuses
-        mock_filled = MagicMock(spec=ExecutionModel)
-        mock_filled.id = 1
-        mock_filled.status = "filled"
-        mock_filled.result_data = json.dumps({"is_test_mode": False})
-        mock_filled.created_at = datetime.now(timezone.utc)
-
-        mock_partial = MagicMock(spec=ExecutionModel)
-        mock_partial.id = 2
-        mock_partial.status = "partial"
-        mock_partial.result_data = json.dumps({"is_test_mode": False})
-        mock_partial.created_at = datetime.now(timezone.utc)
-
-        mock_failed = MagicMock(spec=ExecutionModel)
-        mock_failed.id = 3
-        mock_failed.status = "failed"
-        mock_failed.result_data = json.dumps({"is_test_mode": False})
-        mock_failed.created_at = datetime.now(timezone.utc)
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_filled, mock_partial, mock_failed]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            ("extended", "filled", {"is_test_mode": False}),
+            ("extended", "partial", {"is_test_mode": False}),
+            ("extended", "failed", {"is_test_mode": False}),
+            ("extended", "pending", {"is_test_mode": False}),
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_execution_stats(period="today")
+        stats = await stats_service.get_execution_stats(period="today")
 
         assert stats.total == 3
         assert stats.successful == 1
@@ -643,50 +749,17 @@ class TestGetExecutionStats:
         assert stats.failed == 1
 
     @pytest.mark.asyncio
-    async def test_success_rate_includes_partial(self):
+    async def test_success_rate_includes_partial(self, stats_service, add_executions):
         """Test success_rate = (successful + partial) / total * 100 (AC#2)."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
         # Create 8 filled + 2 partial + 1 failed = 11 total
         # Success rate = (8 + 2) / 11 * 100 = 90.91%
-        executions = []
-        for i in range(8):
-            mock = MagicMock(spec=ExecutionModel)
-            mock.id = i + 1
-            mock.status = "filled"
-            mock.result_data = json.dumps({"is_test_mode": False})
-            mock.created_at = datetime.now(timezone.utc)
-            executions.append(mock)
-
-        for i in range(2):
-            mock = MagicMock(spec=ExecutionModel)
-            mock.id = i + 9
-            mock.status = "partial"
-            mock.result_data = json.dumps({"is_test_mode": False})
-            mock.created_at = datetime.now(timezone.utc)
-            executions.append(mock)
-
-        mock_failed = MagicMock(spec=ExecutionModel)
-        mock_failed.id = 11
-        mock_failed.status = "failed"
-        mock_failed.result_data = json.dumps({"is_test_mode": False})
-        mock_failed.created_at = datetime.now(timezone.utc)
-        executions.append(mock_failed)
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = executions
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            *[("extended", "filled", {"is_test_mode": False})] * 8,
+            *[("extended", "partial", {"is_test_mode": False})] * 2,
+            ("extended", "failed", {"is_test_mode": False}),
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_execution_stats(period="today")
+        stats = await stats_service.get_execution_stats(period="today")
 
         assert stats.total == 11
         assert stats.successful == 8
@@ -695,23 +768,9 @@ class TestGetExecutionStats:
         assert stats.success_rate == "90.91%"
 
     @pytest.mark.asyncio
-    async def test_zero_executions_returns_na(self):
+    async def test_zero_executions_returns_na(self, stats_service):
         """Test zero executions returns 'N/A' not divide by zero (AC#3)."""
-        from kitkat.services.stats import StatsService
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []  # No executions
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_execution_stats(period="today")
+        stats = await stats_service.get_execution_stats(period="today")
 
         assert stats.total == 0
         assert stats.successful == 0
@@ -720,37 +779,14 @@ class TestGetExecutionStats:
         assert stats.success_rate == "N/A"
 
     @pytest.mark.asyncio
-    async def test_excludes_test_mode_executions(self):
+    async def test_excludes_test_mode_executions(self, stats_service, add_executions):
         """Test test mode executions are excluded from counts (AC#4)."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
-        # One real, one test mode
-        mock_real = MagicMock(spec=ExecutionModel)
-        mock_real.id = 1
-        mock_real.status = "filled"
-        mock_real.result_data = json.dumps({"is_test_mode": False})
-        mock_real.created_at = datetime.now(timezone.utc)
-
-        mock_test = MagicMock(spec=ExecutionModel)
-        mock_test.id = 2
-        mock_test.status = "filled"
-        mock_test.result_data = json.dumps({"is_test_mode": True})  # Test mode
-        mock_test.created_at = datetime.now(timezone.utc)
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_real, mock_test]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            ("extended", "filled", {"is_test_mode": False}),
+            ("mock", "filled", {"is_test_mode": True}),  # Test mode
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_execution_stats(period="today")
+        stats = await stats_service.get_execution_stats(period="today")
 
         # Only the real execution counts
         assert stats.total == 1
@@ -758,57 +794,21 @@ class TestGetExecutionStats:
         assert stats.success_rate == "100.00%"
 
     @pytest.mark.asyncio
-    async def test_excludes_test_mode_string_true(self):
+    async def test_excludes_test_mode_string_true(self, stats_service, add_executions):
         """Test test mode exclusion handles 'true' string value."""
-        from kitkat.database import ExecutionModel
-        from kitkat.services.stats import StatsService
-
-        mock_real = MagicMock(spec=ExecutionModel)
-        mock_real.id = 1
-        mock_real.status = "filled"
-        mock_real.result_data = json.dumps({"is_test_mode": False})
-        mock_real.created_at = datetime.now(timezone.utc)
-
-        mock_test = MagicMock(spec=ExecutionModel)
-        mock_test.id = 2
-        mock_test.status = "filled"
-        mock_test.result_data = json.dumps({"is_test_mode": "true"})  # String "true"
-        mock_test.created_at = datetime.now(timezone.utc)
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_real, mock_test]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        await add_executions(
+            ("extended", "filled", {"is_test_mode": False}),
+            ("mock", "filled", {"is_test_mode": "true"}),  # String "true"
+        )
 
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_execution_stats(period="today")
+        stats = await stats_service.get_execution_stats(period="today")
 
         assert stats.total == 1  # Only real execution
 
     @pytest.mark.asyncio
-    async def test_all_time_period(self):
+    async def test_all_time_period(self, stats_service):
         """Test all_time period includes historical data."""
-        from kitkat.services.stats import StatsService
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        mock_factory = MagicMock()
-        mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-
-        service = StatsService(session_factory=mock_factory)
-        stats = await service.get_execution_stats(period="all_time")
+        stats = await stats_service.get_execution_stats(period="all_time")
 
         # Just verify it doesn't error and returns valid structure
         assert stats.total == 0
@@ -824,30 +824,20 @@ class TestExecutionStatsCaching:
 
         service = StatsService(session_factory=MagicMock())
 
-        # Execution stats should use "exec:" prefix
         key = service._get_exec_cache_key(user_id=123, period="today")
-        assert key == "exec:123:today"
+        assert key == (123, "today")
 
         key_all = service._get_exec_cache_key(user_id=None, period="this_week")
-        assert key_all == "exec:all:this_week"
+        assert key_all == (None, "this_week")
 
     @pytest.mark.asyncio
     async def test_execution_stats_cached(self):
         """Test execution stats are cached after first query."""
-        from kitkat.database import ExecutionModel
         from kitkat.services.stats import StatsService
 
-        mock_filled = MagicMock(spec=ExecutionModel)
-        mock_filled.id = 1
-        mock_filled.status = "filled"
-        mock_filled.result_data = json.dumps({"is_test_mode": False})
-        mock_filled.created_at = datetime.now(timezone.utc)
-
         mock_session = AsyncMock()
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_filled]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [("filled", 1)]
         mock_session.execute = AsyncMock(return_value=mock_result)
 
         mock_factory = MagicMock()
@@ -874,23 +864,20 @@ class TestExecutionStatsCaching:
         from kitkat.services.stats import StatsService
 
         service = StatsService(session_factory=MagicMock())
-        now = datetime.now(timezone.utc)
-
-        # Initialize _exec_cache lazily (as done in get_execution_stats)
-        service._exec_cache = {}
+        now = time.monotonic()
 
         # Add to both caches
         exec_stats = ExecutionPeriodStats(
             total=10, successful=9, failed=1, partial=0, success_rate="90.00%"
         )
-        service._exec_cache["exec:all:today"] = (exec_stats, now)
-        service._volume_cache["all:all:today"] = (
+        service._exec_cache[(None, "today")] = (exec_stats, now)
+        service._volume_cache[(None, None, "today")] = (
             VolumeStats(
                 dex_id="all",
                 period="today",
                 volume_usd=Decimal("1000"),
                 execution_count=10,
-                last_updated=now,
+                last_updated=datetime.now(timezone.utc),
             ),
             now,
         )
@@ -131,6 +131,20 @@ class TestSignalModel:
         assert any(col[1] == "id" and col[5] == 1 for col in columns)
 
 
+class TestExecutionModel:
+    """Test ExecutionModel schema."""
+
+    @pytest.mark.asyncio
+    async def test_stats_composite_index(self, test_db_session: AsyncSession):
+        """Test the (status, created_at) index used by stats queries exists."""
+        result = await test_db_session.execute(
+            text("PRAGMA index_info('ix_executions_status_created_at')")
+        )
+        columns = [row[2] for row in result.fetchall()]
+
+        assert columns == ["status", "created_at"]
+
+
 class TestSignalCreationAndPersistence:
     """Tests for Signal model creation and data persistence."""
 